@@ -507,8 +507,13 @@ class Event(abc.ABC):
             instruction.to_emevd_writer(writer)
 
     def pack_instruction_base_args(self, writer: BinaryWriter, base_args_data_offset: int):
+        """Pack base args of all instructions into one buffer, which is appended to `writer` in a single call."""
+        buffer = bytearray(self.total_args_size)
+        buffer_local_offset = writer.position - base_args_data_offset
+        buffer_offset = 0
         for instruction in self.instructions:
-            instruction.pack_base_args(writer, base_args_data_offset)
+            buffer_offset = instruction.pack_base_args(writer, buffer, buffer_offset, buffer_local_offset)
+        writer.append(buffer)
 
     def pack_event_arg_replacements(self, writer: BinaryWriter, event_arg_replacements_offset: int) -> int:
         """Returns the number of event arg replacements written (for summing in EMEVD header)."""
@@ -341,13 +341,23 @@ class Instruction(abc.ABC):
         if not writer.long_varints:
             writer.pad(4)
 
-    def pack_base_args(self, writer: BinaryWriter, base_args_start_offset: int):
+    def pack_base_args(
+        self, writer: BinaryWriter, buffer: bytearray, buffer_offset: int, buffer_local_offset: int
+    ) -> int:
+        """Pack base args into `buffer` (shared by all instructions in the `Event`) at `buffer_offset`.
+
+        `buffer_local_offset` is the offset of `buffer` relative to the start of all base arg data. Returns the buffer
+        offset of the next instruction's base args.
+        """
         if self.category == 1014:  # 'DefineLabel' category has NO arg data offset, not even to empty bytes
             writer.fill("base_args_local_offset", -1, obj=self)
-            return
-        writer.fill("base_args_local_offset", writer.position - base_args_start_offset, obj=self)
-        packed_base_args = struct.pack(f"@{self.struct_args_fmt}0i", *self.args_list) if self.args_list else b""
-        writer.append(packed_base_args)
+            return buffer_offset
+        writer.fill("base_args_local_offset", buffer_local_offset + buffer_offset, obj=self)
+        if not self.args_list:
+            return buffer_offset
+        args_fmt = f"@{self.struct_args_fmt}0i"
+        struct.pack_into(args_fmt, buffer, buffer_offset, *self.args_list)
+        return buffer_offset + struct.calcsize(args_fmt)
 
     def pack_event_layers(
         self, writer: BinaryWriter, existing_event_layers: dict[EventLayers, int], event_layers_start_offset: int
@@ -3,6 +3,7 @@ from __future__ import annotations
 __all__ = [
     "EventArgumentData",
     "get_coord_entity_type",
+    "get_item_type",
     "boolify",
     "get_write_offset",
     "get_instruction_args",
@@ -14,6 +15,7 @@ import logging
 import struct
 import typing as tp
 from enum import IntEnum
+from functools import lru_cache
 
 from soulstruct.base.game_types import GameObjectInt, GAME_INT_TYPE
 
@@ -68,11 +70,31 @@ def get_coord_entity_type(
     raise KeyError(f"Cannot auto-detect `CoordEntityType` from argument type: {arg_or_type.__name__}")
 
 
+@lru_cache(maxsize=None)
+def _get_item_type_of_class(item_class: type) -> IntEnum | None:
+    """Resolve `get_item_enum()` once per item class. Returns `None` for untyped (e.g. plain `int`) items."""
+    get_item_enum = getattr(item_class, "get_item_enum", None)
+    if get_item_enum is None:
+        return None
+    return get_item_enum()
+
+
+def get_item_type(item) -> IntEnum:
+    """Automatically detect `ItemType` from the class of typed `item` (e.g. `WeaponParam`)."""
+    item_type = _get_item_type_of_class(item.__class__)
+    if item_type is None:
+        raise AttributeError("Item type not detected. Use keyword or typed item.")
+    return item_type
+
+
+@lru_cache(maxsize=None)
 def get_byte_offset_from_struct(format_string: str) -> dict[int, tuple[int, str]]:
     """Returns a dictionary mapping `byte_offset` to `(struct_index, struct_format)` tuples.
 
     The byte offsets indicate where the associated element in the struct format string begins. Note that native byte
     alignment "@" is critical here, as EMEVD uses byte-aligned packed binary data.
+
+    Cached per format string, as every instruction with the same EMEDF signature shares it. Do not modify the result.
     """
     format_string = format_string.replace("|", "")
     byte_offset_array = {}
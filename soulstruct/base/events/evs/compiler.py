@@ -29,11 +29,18 @@ class EVSInstructionCompiler:
     custom_funcs: dict[str, tp.Callable]
     custom_func_condition_args: dict[str, tuple[int, int]]
     emedf_aliases: dict[str, tuple[int, int, dict]]
+    # Per-alias EMEDF information that does not depend on instruction arguments, resolved on first use of each alias.
+    # Maps alias names to `(category, index, instr_info, partial_kwargs, signature, evs_defaults, emedf_args)` tuples.
+    _resolved_aliases: dict[str, tuple[int, int, dict, dict | None, tuple[str, ...], tuple, tuple]]
+    # Default `arg_types` (from EMEDF internal types) for each instruction alias, resolved on first use.
+    _default_arg_types: dict[str, str]
 
     def __init__(self, emedf_aliases):
         self.custom_funcs = {}
         self.custom_func_condition_args = {}
         self.emedf_aliases = emedf_aliases
+        self._resolved_aliases = {}
+        self._default_arg_types = {}
 
     def compile(self, instr_name: str, *args, cond: EVSConditionManager = None, **kwargs) -> list[str]:
         """Compile instruction using `COMPILER` function if available, or fall back to `base_compile_instruction`
@@ -42,22 +49,27 @@ class EVSInstructionCompiler:
 
         `cond` can be passed in to manage conditions.
         """
-        if instr_name[0] != "_" and instr_name in self.custom_funcs:
-
-            if cond is not None:
-                output_condition_index, input_condition_index = self.custom_func_condition_args[instr_name]
-                if output_condition_index is not None:
-                    condition = kwargs.get("condition", args[output_condition_index])
-                    if input_condition_index is not None:
-                        input_condition = kwargs.get("input_condition", args[input_condition_index])
-                        cond[condition].activate_with_child(input_condition)
-                    else:
-                        cond[condition].activate()
-
-            # `cond` not passed to custom function.
-            return self.custom_funcs[instr_name](*args, **kwargs)
+        if instr_name[0] == "_":
+            return self.base_compile_instruction(instr_name.lstrip("_"), *args, cond=cond, **kwargs)
+        custom_func = self.custom_funcs.get(instr_name)  # single lookup for the common (non-custom) case
+        if custom_func is None:
+            return self.base_compile_instruction(instr_name, *args, cond=cond, **kwargs)
+
+        if cond is not None:
+            output_condition_index, input_condition_index = self.custom_func_condition_args[instr_name]
+            if output_condition_index is not None:
+                # Positional argument is only indexed if not given by keyword (it may not exist).
+                condition = kwargs["condition"] if "condition" in kwargs else args[output_condition_index]
+                if input_condition_index is not None:
+                    input_condition = (
+                        kwargs["input_condition"] if "input_condition" in kwargs else args[input_condition_index]
+                    )
+                    cond[condition].activate_with_child(input_condition)
+                else:
+                    cond[condition].activate()
 
-        return self.base_compile_instruction(instr_name.lstrip("_"), *args, cond=cond, **kwargs)
+        # `cond` not passed to custom function.
+        return custom_func(*args, **kwargs)
 
     def base_compile_instruction(
         self, instr_name: str, *args, arg_types="", cond: EVSConditionManager = None, **kwargs
@@ -73,13 +85,14 @@ class EVSInstructionCompiler:
 
         Returns a list of numeric instruction strings.
         """
-        category, index, instr_info = self.emedf_aliases[instr_name]
-        emedf_args_info = instr_info["args"]
-        evs_args_info = instr_info.get("evs_args", emedf_args_info)
-
-        is_partial = "partials" in instr_info and instr_name in instr_info["partials"]
-        partial_kwargs = instr_info["partials"][instr_name] if is_partial else {}
-        signature = [arg_name for arg_name in evs_args_info if arg_name not in partial_kwargs]
+        try:
+            resolved = self._resolved_aliases[instr_name]
+        except KeyError:
+            resolved = self._resolve_alias(instr_name)
+        category, index, instr_info, partial_kwargs, full_signature, evs_defaults, emedf_args = resolved
+        is_partial = partial_kwargs is not None
+        alias_name = instr_name
+        signature = list(full_signature)
 
         # Build real `evs_kwargs` from `args` and `kwargs`. Default values for missing arguments will be found below.
         args = list(args)
@@ -138,7 +151,7 @@ class EVSInstructionCompiler:
 
         if is_partial:
             # Fill in baked keyword arguments and redirect name.
-            for arg_name, baked_value in instr_info["partials"][instr_name].items():
+            for arg_name, baked_value in partial_kwargs.items():
                 if arg_name in evs_kwargs:
                     raise ValueError(
                         f"Keyword '{arg_name}' should not be given to partially baked instruction '{instr_name}'."
@@ -147,12 +160,9 @@ class EVSInstructionCompiler:
             instr_name = instr_info["alias"]
 
         # Fill in default EVS arguments.
-        for evs_arg_name, evs_arg_info in evs_args_info.items():
-            if not evs_arg_info:
-                evs_arg_info = emedf_args_info[evs_arg_name]
-            if evs_arg_name not in evs_kwargs or evs_kwargs[evs_arg_name] is None:
+        for evs_arg_name, default in evs_defaults:
+            if evs_kwargs.get(evs_arg_name) is None:
                 # Some custom instructions may pass in `None` as a value that needs a default here.
-                default = evs_arg_info["default"]
                 if default is None:
                     raise ValueError(
                         f"Missing required argument for instruction '{instr_name}' "
@@ -174,7 +184,12 @@ class EVSInstructionCompiler:
             raise ValueError(f"Arguments not found for instruction ({category}, {index}) '{instr_name}': {signature}")
 
         if not arg_types:
-            arg_types = "".join(arg["internal_type"].get_fmt() for arg in emedf_args_info.values())
+            try:
+                arg_types = self._default_arg_types[alias_name]
+            except KeyError:
+                arg_types = self._default_arg_types[alias_name] = "".join(
+                    arg["internal_type"].get_fmt() for arg in instr_info["args"].values()
+                )
         arg_list = []
         arg_loads = []
 
@@ -205,11 +220,11 @@ class EVSInstructionCompiler:
                 arg_list.append(value)
 
         # Convert EVS arguments to EMEVD.
-        for arg_name, arg_info in emedf_args_info.items():
-            if "from_evs" in arg_info:
-                _append_emevd_arg(arg_info["from_evs"](evs_kwargs))
+        for arg_name, arg_info, from_evs, is_tuple in emedf_args:
+            if from_evs is not None:
+                _append_emevd_arg(from_evs(evs_kwargs))
                 arg_index += 1
-            elif arg_info["type"] is tuple:
+            elif is_tuple:
                 # Unpack values.
                 for element in evs_kwargs.pop(arg_name):
                     _append_emevd_arg(element)
@@ -226,6 +241,36 @@ class EVSInstructionCompiler:
         instruction_string = f"{category: 5d}[{index:02d}] ({arg_types}){arg_list}"
         return [instruction_string] + arg_loads
 
+    def _resolve_alias(self, instr_name: str) -> tuple[int, int, dict, dict | None, tuple[str, ...], tuple, tuple]:
+        """Look up EMEDF information for `instr_name` and cache everything that does not depend on call arguments.
+
+        `partial_kwargs` is `None` if `instr_name` is not a partially baked alias of another instruction. `signature`
+        contains all EVS argument names that must be given (or have defaults) for this alias. `evs_defaults` contains
+        `(evs_arg_name, default)` pairs and `emedf_args` contains `(arg_name, arg_info, from_evs, is_tuple)` entries
+        for converting EVS arguments to EMEVD, so `base_compile_instruction()` does not re-inspect EMEDF per call.
+        """
+        category, index, instr_info = self.emedf_aliases[instr_name]
+        emedf_args_info = instr_info["args"]
+        evs_args_info = instr_info.get("evs_args", emedf_args_info)
+        if "partials" in instr_info and instr_name in instr_info["partials"]:
+            partial_kwargs = instr_info["partials"][instr_name]
+            signature = tuple(arg_name for arg_name in evs_args_info if arg_name not in partial_kwargs)
+        else:
+            partial_kwargs = None
+            signature = tuple(evs_args_info)
+        evs_defaults = tuple(
+            (evs_arg_name, (evs_arg_info or emedf_args_info[evs_arg_name]).get("default"))
+            for evs_arg_name, evs_arg_info in evs_args_info.items()
+        )
+        emedf_args = tuple(
+            (arg_name, arg_info, arg_info.get("from_evs"), arg_info.get("type") is tuple)
+            for arg_name, arg_info in emedf_args_info.items()
+        )
+        resolved = self._resolved_aliases[instr_name] = (
+            category, index, instr_info, partial_kwargs, signature, evs_defaults, emedf_args
+        )
+        return resolved
+
     def add_custom_instruction(self, func: tp.Callable) -> tp.Callable:
         """Decorator that simply adds the decorated function to the `COMPILER` dictionary under its own name.
 
@@ -254,6 +299,18 @@ class BooleanTestCompiler:
     or call `compile_object(game_object)` to pass a single `game_object` to the underlying functions.
     """
 
+    __slots__ = (
+        "_compiler",
+        "skip_if_true",
+        "skip_if_false",
+        "if_true",
+        "if_false",
+        "end_if_true",
+        "end_if_false",
+        "restart_if_true",
+        "restart_if_false",
+    )
+
     def __init__(
         self,
         compiler: EVSInstructionCompiler,
@@ -276,8 +333,11 @@ class BooleanTestCompiler:
         self.restart_if_true = restart_if_true
         self.restart_if_false = restart_if_false
 
-    def set_all(self, true_name: str, false_name: str):
-        """Set all eight test at once using the same basic template, e.g. 'FlagEnabled' and 'FlagDisabled'."""
+    def set_all(self, true_name: str, false_name: str) -> tp.Self:
+        """Set all eight test at once using the same basic template, e.g. 'FlagEnabled' and 'FlagDisabled'.
+
+        Returns this compiler, so fully-templated tests can be built in one expression.
+        """
         self.skip_if_true = f"SkipLinesIf{true_name}"
         self.skip_if_false = f"SkipLinesIf{false_name}"
         self.if_true = f"If{true_name}"
@@ -286,6 +346,7 @@ class BooleanTestCompiler:
         self.end_if_false = f"EndIf{false_name}"
         self.restart_if_true = f"RestartIf{true_name}"
         self.restart_if_false = f"RestartIf{false_name}"
+        return self
 
     def __call__(
         self,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-__all__ = ["EVSParser", "EVSError"]
+__all__ = ["EVSParser", "EVSError", "clear_common_func_cache"]
 
 import abc
 import ast
@@ -25,6 +25,25 @@ from .utils import *
 
 _LOGGER = logging.getLogger("soulstruct")
 
+# Parsed `[COMMON_FUNC]` events, keyed by parser class, resolved module path, resolved importing script directory, and
+# (for "template" mode only) importing map name. Every map script in a game imports the same (large) COMMON_FUNC module,
+# which only needs to be parsed again when it (or a module it imports) changes on disk. Each entry holds
+# `(file_mtimes, events, event_ids)`, where `file_mtimes` are the `(path, st_mtime_ns)` pairs of those files, and is
+# replaced when any of them change.
+_COMMON_FUNC_CACHE = {}  # type: dict[tuple, tuple[tuple[tuple[Path, int], ...], dict[str, EventInfo], set[int]]]
+
+
+def clear_common_func_cache():
+    """Discard all cached `[COMMON_FUNC]` modules, so they are parsed again when next imported."""
+    _COMMON_FUNC_CACHE.clear()
+
+
+def _files_unchanged(file_mtimes: tp.Iterable[tuple[Path, int]]) -> bool:
+    try:
+        return all(path.stat().st_mtime_ns == mtime for path, mtime in file_mtimes)
+    except OSError:
+        return False  # file removed or unreadable
+
 
 class EVSParser(abc.ABC):
 
@@ -56,6 +75,7 @@ class EVSParser(abc.ABC):
     for_vars: dict[str, tp.Any]  # local to each event function
     events: dict[str, EventInfo]  # information about each event function (collected before proper statement parsing)
     event_ids: set[int]  # set of event IDs used, so duplicates can easily be spotted
+    imported_module_files: list[Path]  # source files of modules imported by this EVS script
     common_func_events: dict[str, EventInfo]  # imported or passed in from another EVS module
     common_func_event_ids: set[int]  # imported or passed in from another EVS module
     script_event_flags: dict[str, int]
@@ -104,6 +124,7 @@ class EVSParser(abc.ABC):
 
         self.events = {}  # Maps your event names to their IDs, so you can call them to initialize them.
         self.event_ids = set()  # Used to ensure the same ID is not repeated.
+        self.imported_module_files = []
         self.common_func_events = {}
         self.common_func_event_ids = set()
 
@@ -171,18 +192,32 @@ class EVSParser(abc.ABC):
                     cf_module_name, "", f"Cannot import missing COMMON_FUNC file: {cf_module_path}"
                 )
 
-            if self.SUPPORTS_COMMON_FUNC:
-                common_func_evs = self.__class__(
-                    cf_module_path, script_directory=self.script_directory
+            cache_key = (
+                self.__class__,
+                cf_module_path.resolve(),
+                self.script_directory.resolve(),  # COMMON_FUNC module's own imports are resolved from here
+                None if self.SUPPORTS_COMMON_FUNC else self.map_name,
+            )
+            if (cached := _COMMON_FUNC_CACHE.get(cache_key)) is None or not _files_unchanged(cached[0]):
+                if self.SUPPORTS_COMMON_FUNC:
+                    common_func_evs = self.__class__(
+                        cf_module_path, script_directory=self.script_directory
+                    )
+                else:
+                    # "Template" mode to assist early games like DS1 with common-func-like imports.
+                    common_func_evs = self.__class__(  # force this map's base flag
+                        cf_module_path, map_name=self.map_name, script_directory=self.script_directory
+                    )
+                file_mtimes = tuple(
+                    (path, path.stat().st_mtime_ns)
+                    for path in (cf_module_path, *common_func_evs.imported_module_files)
                 )
-            else:
-                # "Template" mode to assist early games like DS1 with common-func-like imports.
-                common_func_evs = self.__class__(  # force this map's base flag
-                    cf_module_path, map_name=self.map_name, script_directory=self.script_directory
+                cached = _COMMON_FUNC_CACHE[cache_key] = (
+                    file_mtimes, common_func_evs.events, common_func_evs.event_ids
                 )
 
-            self.common_func_events = common_func_evs.events.copy()  # shallow
-            self.common_func_event_ids = common_func_evs.event_ids.copy()  # shallow
+            self.common_func_events = cached[1].copy()  # shallow
+            self.common_func_event_ids = cached[2].copy()  # shallow
 
             # Otherise, star import preserves all names from common module.
 
@@ -315,9 +350,16 @@ class EVSParser(abc.ABC):
         for node in self.tree.body[1:]:
             # Parse root-level module nodes.
             if isinstance(node, ast.Import):
-                self.globals |= import_module(node, ignore_names=ignore_import_names)
+                self.globals |= import_module(
+                    node, ignore_names=ignore_import_names, module_files=self.imported_module_files
+                )
             elif isinstance(node, ast.ImportFrom):
-                self.globals |= import_from(node, self.script_directory, ignore_names=ignore_import_names)
+                self.globals |= import_from(
+                    node,
+                    self.script_directory,
+                    ignore_names=ignore_import_names,
+                    module_files=self.imported_module_files,
+                )
             elif isinstance(node, ast.FunctionDef):
                 self._scan_event(node)
             elif isinstance(node, ast.Assign):
@@ -369,10 +411,12 @@ class EVSParser(abc.ABC):
             return event_emevd
 
         for node in event_info.nodes:
-            node = as_event_statement_node(
-                node,
-                f"Invalid line: {ast.dump(node)}. Must be `Condition()` assignment, IF/ELSE block, or instruction.",
-            )
+            # Check type first, so `ast.dump()` is only formatted for invalid lines (not eagerly for every valid one).
+            if not isinstance(node, EVENT_STATEMENT_NODES):
+                raise EVSSyntaxError(
+                    node,
+                    f"Invalid line: {ast.dump(node)}. Must be `Condition()` assignment, IF/ELSE block, or instruction.",
+                )
             built_function = self._compile_event_body_node(node)
             if built_function is None:
                 raise EVSSyntaxError(node, "Builder returned None for instruction.")
@@ -912,12 +956,9 @@ class EVSParser(abc.ABC):
                 arg = self.current_event.args[name]
             except KeyError:
                 raise NoSkipOrReturnError
-            if not negate:  # note inversion
-                return self._compile_instr(
-                    node, "SkipLinesIfValueComparison", skip_lines, NEG_COMPARISON_NODES[op_node], arg, comparison_value
-                )
+            comparison_type = SKIP_COMPARISON_TYPES[op_node][negate]  # table is pre-inverted for skipping
             return self._compile_instr(
-                node, "SkipLinesIfValueComparison", skip_lines, COMPARISON_NODES[op_node], arg, comparison_value
+                node, "SkipLinesIfValueComparison", skip_lines, comparison_type, arg, comparison_value
             )
         raise NoSkipOrReturnError
 
@@ -1026,7 +1067,7 @@ class EVSParser(abc.ABC):
                 emevd_args += self._parse_nodes(node.args)
                 emevd_kwargs.update(self._parse_keyword_nodes(node.keywords))
                 emevd_kwargs.update(
-                    comparison_type=(NEG_COMPARISON_NODES if negate else COMPARISON_NODES)[op_node],
+                    comparison_type=COMPARISON_TYPES[op_node][negate],
                     value=comparison_value,
                 )
 
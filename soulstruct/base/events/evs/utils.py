@@ -3,6 +3,8 @@ from __future__ import annotations
 __all__ = [
     "COMPARISON_NODES",
     "NEG_COMPARISON_NODES",
+    "COMPARISON_TYPES",
+    "SKIP_COMPARISON_TYPES",
 
     "MAP_ID_RE",
     "COMMON_FUNC_IMPORT_RE",
@@ -17,6 +19,7 @@ __all__ = [
     "EVENT_ARG_TYPE_MSG",
 
     "EventStatementTyping",
+    "EVENT_STATEMENT_NODES",
     "ConditionNodeTyping",
     "SkipReturnTyping",
 
@@ -55,6 +58,12 @@ _LOGGER = logging.getLogger("soulstruct")
 
 COMPARISON_NODES = {ast.Eq: 0, ast.NotEq: 1, ast.Gt: 2, ast.Lt: 3, ast.GtE: 4, ast.LtE: 5}
 NEG_COMPARISON_NODES = {ast.Eq: 1, ast.NotEq: 0, ast.Gt: 5, ast.Lt: 4, ast.GtE: 3, ast.LtE: 2}
+# Maps comparison nodes to `(comparison_type, negated_comparison_type)`, so `COMPARISON_TYPES[op_node][negate]` gives
+# the EMEVD comparison type with a single lookup.
+COMPARISON_TYPES = {node: (COMPARISON_NODES[node], NEG_COMPARISON_NODES[node]) for node in COMPARISON_NODES}
+# Pre-inverted for `SkipLines` instructions, which must skip an IF block when its test is false, so they can also be
+# indexed by `negate` directly (rather than `[not negate]` on every call).
+SKIP_COMPARISON_TYPES = {node: (NEG_COMPARISON_NODES[node], COMPARISON_NODES[node]) for node in COMPARISON_NODES}
 
 MAP_ID_RE = re.compile(r"m(\d\d)_(\d\d)_")
 COMMON_FUNC_IMPORT_RE = re.compile(
@@ -83,6 +92,7 @@ EVENT_ARG_TYPE_MSG = f"""
 
 # TODO: Use `tp.TypeGuard` to assert these node type unions.
 EventStatementTyping = tp.Union[ast.Expr, ast.For, ast.If, ast.Assign, ast.Return]
+EVENT_STATEMENT_NODES = (ast.Expr, ast.For, ast.If, ast.Assign, ast.Return)  # for `isinstance` checks
 ConditionNodeTyping = tp.Union[ast.UnaryOp, ast.BoolOp, ast.Compare, ast.Name, ast.Attribute, ast.Call]
 SkipReturnTyping = tp.Union[ast.UnaryOp, ast.Name, ast.Attribute, ast.Compare, ast.Call]
 
@@ -207,7 +217,10 @@ def parse_event_arguments(
     return arg_dict, arg_types, arg_classes
 
 
-def import_module(node: ast.Import, ignore_names: list[str] = ()) -> dict[str, tp.Any]:
+def import_module(
+    node: ast.Import, ignore_names: list[str] = (), module_files: list[Path] = None
+) -> dict[str, tp.Any]:
+    """Import names into given namespace dictionary. Source files of imported modules are added to `module_files`."""
     module_dict = {}
     for alias in node.names:
         name = alias.name
@@ -218,6 +231,8 @@ def import_module(node: ast.Import, ignore_names: list[str] = ()) -> dict[str, t
             importlib.reload(module)
         except ImportError as e:
             raise EVSImportError(node, alias.name, str(e))
+        if module_files is not None and getattr(module, "__file__", None):
+            module_files.append(Path(module.__file__))
         as_name = alias.asname if alias.asname is not None else name
         try:
             module_dict[as_name] = getattr(module, name)
@@ -228,9 +243,9 @@ def import_module(node: ast.Import, ignore_names: list[str] = ()) -> dict[str, t
 
 
 def import_from(
-    node: ast.ImportFrom, script_directory: Path, ignore_names: list[str] = ()
+    node: ast.ImportFrom, script_directory: Path, ignore_names: list[str] = (), module_files: list[Path] = None
 ) -> dict[str, tp.Any]:
-    """Import names into given namespace dictionary."""
+    """Import names into given namespace dictionary. Source file of imported module is added to `module_files`."""
     if node.module in ignore_names:
         return {}
     try:
@@ -262,6 +277,8 @@ def import_from(
                 )
             raise
 
+    if module_files is not None and getattr(module, "__file__", None):
+        module_files.append(Path(module.__file__))
     module_dict = {}
     for alias in node.names:
         name = alias.name
@@ -348,7 +365,7 @@ def define_args(arg_types: str) -> list[tuple[int, int]]:
 
 def as_event_statement_node(node: ast.stmt, msg="") -> EventStatementTyping:
     """Intellisense hack to check and validate node type."""
-    if not isinstance(node, (ast.Expr, ast.For, ast.If, ast.Assign, ast.Return)):
+    if not isinstance(node, EVENT_STATEMENT_NODES):
         raise EVSSyntaxError(node, msg or f"Invalid Event Statement node: {ast.dump(node)}")
     return node
 
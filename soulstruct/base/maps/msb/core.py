@@ -27,7 +27,7 @@ from .events import BaseMSBEvent
 from .models import BaseMSBModel
 from .parts import BaseMSBPart
 from .regions import BaseMSBRegion
-from .utils import GroupBitSet, MSBSubtypeInfo
+from .utils import GroupBitSet, GroupBitSet128, GroupBitSet256, GroupBitSet1024, MSBSubtypeInfo
 
 if tp.TYPE_CHECKING:
     from .enums import BaseMSBSubtype
@@ -79,11 +79,19 @@ class MSB(GameFile, tp.Generic[MSB_MODEL_T, MSB_EVENT_T, MSB_REGION_T, MSB_PART_
     class JSONEncoder(json.JSONEncoder):
         """Handles a few extra types that appear as `MSBEntry` field types."""
 
+        # Exact types encoded as their `repr()`, checked with a single set look-up before any `isinstance` calls.
+        _REPR_TYPES: tp.ClassVar[frozenset[type]] = frozenset(
+            {Vector2, Vector3, Vector4, GroupBitSet128, GroupBitSet256, GroupBitSet1024}
+        )
+
         def default(self, obj):
+            if type(obj) in self._REPR_TYPES:
+                return repr(obj)
             if isinstance(obj, RegionShape):
                 return obj.to_json_dict()
             if isinstance(obj, (Vector2, Vector3, Vector4, GroupBitSet)):
                 return repr(obj)
+            return super().default(obj)  # raises `TypeError`
 
     EXT: tp.ClassVar[str] = ".msb"
 
@@ -275,6 +283,23 @@ class MSB(GameFile, tp.Generic[MSB_MODEL_T, MSB_EVENT_T, MSB_REGION_T, MSB_PART_
         # noinspection PyTypeChecker
         return self.get_supertype_list("PARTS_PARAM_ST")    
 
+    def get_collisions_and_other_parts(self) -> tuple[IDList[MSB_PART_T], IDList[MSB_PART_T]]:
+        """Split all Parts into those with a `reflect_plane_height` field (Collisions) and all other Parts.
+
+        Each subtype list is classified once by its entry class, rather than checking every Part.
+        """
+        parts_supertype = self.resolve_supertype_name("PARTS_PARAM_ST")
+        collisions = IDList()
+        other_parts = IDList()
+        for subtype_list in self:
+            if subtype_list.supertype == parts_supertype:
+                if hasattr(subtype_list.entry_class, "reflect_plane_height"):
+                    collisions.extend(subtype_list)
+                else:
+                    other_parts.extend(subtype_list)
+        # noinspection PyTypeChecker
+        return collisions, other_parts
+
     def get_regions_with_shape(self, shape_name: str) -> list[MSB_REGION_T]:
         """Find all regions with given shape name. Not case-sensitive, but doesn't work with plurals."""
         name = shape_name.lower()
@@ -10,13 +10,14 @@ __all__ = [
 ]
 
 import abc
-import ast
 import logging
 import re
+import struct
 import typing as tp
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field
+
+import numpy as np
 
-from soulstruct.utilities.conversion import int_group_to_bit_set, bit_set_to_int_group
 from soulstruct.utilities.maths import Matrix3, Vector3, resolve_rotation
 
 if tp.TYPE_CHECKING:
@@ -36,21 +37,25 @@ class MSBBrokenEntryReference:
     index: int
 
 
-class MSBSubtypeInfo(tp.NamedTuple):
+@dataclass(slots=True, frozen=True)
+class MSBSubtypeInfo:
     """Typically mapped to by a `BaseMSBSubtype` enum for fast look-up from packed subtype indices."""
     entry_class: type[MSBEntry]
     subtype_list_name: str
+    _lower_names: frozenset[str] = field(init=False, repr=False, compare=False)
 
-    def matches_name(self, name: str) -> bool:
-        """Check if `name` is one of the valid specifiers for this MSB entry subtype."""
+    def __post_init__(self):
         subtype_enum = self.entry_class.SUBTYPE_ENUM
-        name_options = {
+        object.__setattr__(self, "_lower_names", frozenset({
             self.subtype_list_name.lower(),
             subtype_enum.name.lower(),
             subtype_enum.pluralized_name.lower(),
             self.entry_class.__name__.lower(),
-        }
-        return name.lower() in name_options
+        }))
+
+    def matches_name(self, name: str) -> bool:
+        """Check if `name` is one of the valid specifiers for this MSB entry subtype."""
+        return name.lower() in self._lower_names
 
 
 @dataclass(slots=True)
@@ -58,145 +63,194 @@ class GroupBitSet(abc.ABC):
     """Stores the huge, multi-`uint` bitfields used for draw/display/backread/navmesh groups in MSBs.
 
     Handles `list[uint]` representation, `set[int]` representation, and allows custom JSON encoding.
+
+    Internally, enabled bits are stored in a single Python `int` used as a bitvector, so set operations between groups
+    are single (C-level) integer operations.
     """
     BIT_COUNT: tp.ClassVar[int]
     _REPR_RE: tp.ClassVar[re.Pattern]
+    _UINTS_STRUCT: tp.ClassVar[struct.Struct]  # little-endian `uint` array, used to convert to/from `bits` bytes
 
-    # Only field.
-    enabled_bits: set[int]
+    # Only field. Bit `i` of this integer is set if group `i` is enabled.
+    bits: int
 
-    def __init__(self, uint_list_or_bit_set: GroupBitSet | list[int] | set[int] | None):
+    def __init__(self, uint_list_or_bit_set: GroupBitSet | list[int] | tuple[int, ...] | set[int] | None):
+        # Exact type checks are tried first, as they are cheaper than `isinstance`.
+        arg_type = type(uint_list_or_bit_set)
         if uint_list_or_bit_set is None:
             # Default is no enabled bits.
-            self.enabled_bits = set()
-        elif isinstance(uint_list_or_bit_set, self.__class__):
-            # Just copy bits from other instance.
-            self.enabled_bits = uint_list_or_bit_set.enabled_bits.copy()
-        elif isinstance(uint_list_or_bit_set, list):
+            self.bits = 0
+        elif arg_type is self.__class__:
+            # Just copy bits from other instance (no aliasing, as `int` is immutable).
+            self.bits = uint_list_or_bit_set.bits
+        elif arg_type is list or arg_type is tuple:
             # List of unsigned integers (e.g. from packed `MSB` file).
-            self.enabled_bits = int_group_to_bit_set(uint_list_or_bit_set, assert_size=len(uint_list_or_bit_set))
-        elif isinstance(uint_list_or_bit_set, set):
-            if not all(isinstance(i, int) and i < self.BIT_COUNT for i in uint_list_or_bit_set):
+            if len(uint_list_or_bit_set) != self.BIT_COUNT // 32:
+                raise ValueError(
+                    f"List passed to `{self.__class__.__name__}` must contain {self.BIT_COUNT // 32} unsigned "
+                    f"integers, not {len(uint_list_or_bit_set)}."
+                )
+            self.bits = int.from_bytes(self._UINTS_STRUCT.pack(*uint_list_or_bit_set), "little")
+        elif arg_type is set or arg_type is frozenset:
+            if not all(isinstance(i, int) and 0 <= i < self.BIT_COUNT for i in uint_list_or_bit_set):
                 raise TypeError(
                     f"Set passed to `{self.__class__.__name__}` must be integers all less than {self.BIT_COUNT}, not: "
                     f"{uint_list_or_bit_set}"
                 )
-            self.enabled_bits = uint_list_or_bit_set.copy()
+            self.bits = sum(1 << i for i in uint_list_or_bit_set)
+        elif isinstance(uint_list_or_bit_set, self.__class__):
+            self.bits = uint_list_or_bit_set.bits
+        elif isinstance(uint_list_or_bit_set, (list, tuple)):
+            self.__init__(list(uint_list_or_bit_set))  # subclass of supported sequence type
+        elif isinstance(uint_list_or_bit_set, (set, frozenset)):
+            self.__init__(set(uint_list_or_bit_set))  # subclass of supported set type
         else:
-            raise TypeError(f"Cannot initialize `{self.__class__.__name__}` from {type(uint_list_or_bit_set)}.")
+            raise TypeError(f"Cannot initialize `{self.__class__.__name__}` from {arg_type}.")
+
+    @classmethod
+    def from_bits(cls, bits: int) -> tp.Self:
+        """Create directly from a bitvector `int`, skipping `__init__` argument checks."""
+        instance = cls.__new__(cls)
+        instance.bits = bits
+        return instance
 
     @classmethod
     def from_range(cls, first_bit: int, last_bit: int) -> tp.Self:
         """Create a `GroupBitSet` with all bits in the given range enabled (inclusive at both ends)."""
-        if not 0 <= first_bit <= last_bit <= cls.BIT_COUNT:
+        if not 0 <= first_bit <= last_bit < cls.BIT_COUNT:
             raise ValueError(f"Invalid range for `{cls.__name__}`: {first_bit} to {last_bit} (max {cls.BIT_COUNT}).")
-        return cls(set(range(first_bit, last_bit + 1)))
+        return cls.from_bits(((1 << (last_bit - first_bit + 1)) - 1) << first_bit)
 
     @classmethod
     def all_off(cls) -> tp.Self:
-        return cls(set())
+        return cls.from_bits(0)
 
     @classmethod
     def all_on(cls) -> tp.Self:
-        return cls(set(range(cls.BIT_COUNT)))
+        return cls.from_bits((1 << cls.BIT_COUNT) - 1)
 
     @classmethod
     def from_repr(cls, repr_string: str):
         """Also handles JSON decoding."""
         if (match := cls._REPR_RE.match(repr_string)) is None:
             raise ValueError(f"Invalid string/JSON source for `{cls.__name__}`: {repr_string}")
-        bit_tuple = ast.literal_eval(match.group(1))
-        if isinstance(bit_tuple, int):
-            bit_tuple = (bit_tuple,)  # formatting quirk (no single comma for single-element tuple in JSON)
-        return cls(uint_list_or_bit_set=set(bit_tuple))
+        # Empty strings are skipped to tolerate a trailing comma, e.g. `GroupBitSet128(5,)`.
+        enabled_bits = {int(i) for i in match.group(1).split(",") if i.strip()}
+        return cls(uint_list_or_bit_set=enabled_bits)
+
+    @property
+    def enabled_bits(self) -> frozenset[int]:
+        """Frozen set of enabled bit indices.
+
+        NOTE: This used to be a mutable `set` field. It is now derived from `bits`, so it is returned frozen to make
+        in-place changes (e.g. `enabled_bits.add(5)`) fail loudly. Use `add()`, `remove()`, etc. on this instance.
+        """
+        return frozenset(self.to_sorted_bit_list())
 
     def to_sorted_bit_list(self) -> list[int]:
         """For GUI display, mainly."""
-        return sorted(self.enabled_bits)
+        sorted_bits = []
+        bits = self.bits
+        while bits:
+            low_bit = bits & -bits  # isolate lowest enabled bit, so indices are appended in ascending order
+            sorted_bits.append(low_bit.bit_length() - 1)
+            bits ^= low_bit
+        return sorted_bits
 
     def to_uints(self) -> list[int]:
-        return bit_set_to_int_group(enabled_flags=self.enabled_bits, group_size=self.BIT_COUNT // 32)
+        return list(self._UINTS_STRUCT.unpack(self.bits.to_bytes(self.BIT_COUNT // 8, "little")))
 
     def __iter__(self):
         """Enables seamless `BinaryStruct` field packing.
 
-        BEWARE: Do NOT use this to try to iterate over all `enabled_bits`. You must access that field directly.
+        BEWARE: Do NOT use this to try to iterate over all `enabled_bits`. Use `to_sorted_bit_list()` for that.
         """
         return iter(self.to_uints())
 
     def __contains__(self, bit: int) -> bool:
         """Container check for enabled bits (otherwise it would use `__iter__` above and get the uint fields)."""
-        return bit in self.enabled_bits
+        return bit >= 0 and bool(self.bits >> bit & 1)
 
     def __repr__(self) -> str:
         """Also used for JSON."""
-        bit_tuple = "(" + ", ".join(str(i) for i in sorted(self.enabled_bits)) + ")"
-        return f"{self.__class__.__name__}{bit_tuple}"
+        return f"{self.__class__.__name__}({', '.join(map(str, self.to_sorted_bit_list()))})"
 
     def copy(self) -> tp.Self:
-        return self.__class__(self.enabled_bits)
+        return self.from_bits(self.bits)
+
+    def __copy__(self) -> tp.Self:
+        return self.from_bits(self.bits)
+
+    def __deepcopy__(self, memo: dict) -> tp.Self:
+        return self.from_bits(self.bits)
 
     def add(self, bit: int):
-        if not 0 <= bit <= self.BIT_COUNT:
+        if not 0 <= bit < self.BIT_COUNT:
             raise ValueError(f"Bit {bit} is out of range for {self.BIT_COUNT}-bit `{self.__class__.__name__}`.")
-        self.enabled_bits.add(bit)
+        self.bits |= 1 << bit
 
     def remove(self, bit: int):
-        if not 0 <= bit <= self.BIT_COUNT:
+        if not 0 <= bit < self.BIT_COUNT:
             raise ValueError(f"Bit {bit} is out of range for {self.BIT_COUNT}-bit `{self.__class__.__name__}`.")
-        self.enabled_bits.remove(bit)
+        if not self.bits >> bit & 1:
+            raise KeyError(bit)
+        self.bits &= ~(1 << bit)
+
+    def _other_bits(self, other: tp.Self | set[int], operation: str) -> int:
+        """Get bitvector `int` of `other` for a set operation."""
+        if isinstance(other, self.__class__):
+            return other.bits
+        elif isinstance(other, set):
+            return self.__class__(other).bits
+        raise TypeError(
+            f"Cannot {operation} `{self.__class__.__name__}` with {type(other)}. Must be a `set` or the same type."
+        )
 
     def intersection(self, other: tp.Self | set[int]) -> tp.Self:
-        cls = self.__class__
-        if isinstance(other, cls):
-            return cls(self.enabled_bits & other.enabled_bits)
-        elif isinstance(other, set):
-            return cls(self.enabled_bits & other)
-        raise TypeError(f"Cannot intersect `{cls.__name__}` with {type(other)}. Must be a `set` or the same type.")
+        return self.from_bits(self.bits & self._other_bits(other, "intersect"))
 
     def __and__(self, other: tp.Self | set[int]) -> tp.Self:
         return self.intersection(other)
 
     def union(self, other: tp.Self | set[int]) -> tp.Self:
-        cls = self.__class__
-        if isinstance(other, cls):
-            return cls(self.enabled_bits | other.enabled_bits)
-        elif isinstance(other, set):
-            return cls(self.enabled_bits | other)
-        raise TypeError(f"Cannot union `{cls.__name__}` with {type(other)}. Must be a `set` or the same type.")
+        return self.from_bits(self.bits | self._other_bits(other, "union"))
 
     def __or__(self, other: tp.Self | set[int]) -> tp.Self:
         return self.union(other)
 
     def without(self, other: tp.Self | set[int]) -> tp.Self:
-        cls = self.__class__
-        if isinstance(other, cls):
-            return cls(self.enabled_bits - other.enabled_bits)
-        elif isinstance(other, set):
-            return cls(self.enabled_bits - other)
-        raise TypeError(f"Cannot subtract `{cls.__name__}` from {type(other)}. Must be a `set` or the same type.")
+        return self.from_bits(self.bits & ~self._other_bits(other, "subtract"))
 
     def __sub__(self, other: tp.Self | set[int]) -> tp.Self:
         return self.without(other)
 
+    def __xor__(self, other: tp.Self | set[int]) -> tp.Self:
+        return self.from_bits(self.bits ^ self._other_bits(other, "xor"))
+
+    def __invert__(self) -> tp.Self:
+        return self.from_bits(~self.bits & ((1 << self.BIT_COUNT) - 1))
+
 
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet128(GroupBitSet):
     BIT_COUNT: tp.ClassVar[int] = 128
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet128(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet128\(\s*([\d,\s]*)\)\s*$")
+    _UINTS_STRUCT: tp.ClassVar[struct.Struct] = struct.Struct("<4I")
 
 
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet256(GroupBitSet):
     BIT_COUNT: tp.ClassVar[int] = 256
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet256(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet256\(\s*([\d,\s]*)\)\s*$")
+    _UINTS_STRUCT: tp.ClassVar[struct.Struct] = struct.Struct("<8I")
 
 
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet1024(GroupBitSet):
     """For Part collision masks in Elden Ring."""
     BIT_COUNT: tp.ClassVar[int] = 1024
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet1024(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet1024\(\s*([\d,\s]*)\)\s*$")
+    _UINTS_STRUCT: tp.ClassVar[struct.Struct] = struct.Struct("<32I")
 
 
 def merge(msb_1: MSB, msb_2: MSB, filter_func: tp.Callable = None, allow_repeated_names=False) -> MSB:
@@ -212,8 +266,9 @@ def merge(msb_1: MSB, msb_2: MSB, filter_func: tp.Callable = None, allow_repeate
     if filter_func is not None and not callable(filter_func):
         raise ValueError("`filter_func` must be callable, take an `MSBEntry` as its argument, and return a bool.")
 
-    msb_1_field_names = [f.name for f in fields(msb_1)]
-    msb_2_field_names = [f.name for f in fields(msb_2)]
+    # Subtype list names are cached on each `MSB` class.
+    msb_1_field_names = msb_1.get_subtype_list_names()
+    msb_2_field_names = msb_2.get_subtype_list_names()
     if msb_1_field_names != msb_2_field_names:
         raise TypeError(
             f"Cannot merge MSBs with different field names:\n"
@@ -227,7 +282,7 @@ def merge(msb_1: MSB, msb_2: MSB, filter_func: tp.Callable = None, allow_repeate
         msb_1_entries = msb_1_entries.get_filtered_list(filter_func)
         msb_2_entries = getattr(msb_2, subtype_name)  # type: MSBEntryList
         msb_2_entries = msb_2_entries.get_filtered_list(filter_func)
-        repeated_names = set(msb_1_entries.get_entry_names()).intersection(msb_2_entries.get_entry_names())
+        repeated_names = set(msb_1_entries.get_entry_names()) & set(msb_2_entries.get_entry_names())
         if repeated_names:
             if allow_repeated_names:
                 _LOGGER.warning(f"Allowing repeated names in merged MSBs: {list(repeated_names)}")
@@ -237,7 +292,7 @@ def merge(msb_1: MSB, msb_2: MSB, filter_func: tp.Callable = None, allow_repeate
         merged_entry_lists[subtype_name].extend(msb_2_entries)
 
     # noinspection PyArgumentList
-    return msb_1.__class__(**merged_entry_lists)
+    return msb_1.__class__(byte_order=msb_1.byte_order, **merged_entry_lists)
 
 
 def rotate_entry(
@@ -256,6 +311,14 @@ def rotate_entry(
     entry.translate = (rotation @ (entry.translate - pivot_point)) + pivot_point
 
 
+def _resolve_selected_ids(msb: MSB, selected_entries: tp.Sequence[str | MSBEntry]) -> frozenset[int]:
+    """Resolve `selected_entries` (Part/Region instances or unique names) once, returning their IDs for fast filtering.
+
+    Empty if no entries are selected, which the move functions below interpret as selecting all entries.
+    """
+    return frozenset(map(id, msb.resolve_entries_list(selected_entries, supertypes=("parts", "regions"))))
+
+
 def move_map(
     msb: MSB,
     start_translate: Vector3 | None = None,
@@ -294,8 +357,92 @@ def move_map(
     # Apply global rotation to start point to determine required global translation.
     translation = end_translate - (m_world_rotation @ start_translate)  # type: Vector3
 
-    rotate_all_in_world(msb, m_world_rotation, selected_entries=selected_entries)
-    translate_all(msb, translation, selected_entries=selected_entries)
+    selected_ids = _resolve_selected_ids(msb, selected_entries)
+
+    # Rotation and translation are applied to all entries in a single batched pass (rather than calling
+    # `rotate_all_in_world` and then `translate_all`).
+    collisions, other_parts = msb.get_collisions_and_other_parts()
+    collisions = [part for part in collisions if not selected_ids or id(part) in selected_ids]
+    entries = [
+        entry for entry in (*other_parts, *msb.get_regions())
+        if not selected_ids or id(entry) in selected_ids
+    ]
+    _batch_rigid_transform(collisions + entries, m_world_rotation, Vector3.zero(), translation)
+    for collision in collisions:
+        collision.reflect_plane_height += translation.y
+
+
+def _apply_rigid_transform(
+    entry: BaseMSBPart | BaseMSBRegion,
+    rotation: Matrix3,
+    pivot_point: Vector3,
+    translation: Vector3 | None = None,
+):
+    """Rotate `entry` around `pivot_point` by `rotation` matrix and then (optionally) shift it by `translation`.
+
+    Does not check that `entry` has `translate` and `rotate` attributes.
+    """
+    entry.rotate = (rotation @ Matrix3.from_euler_angles(entry.rotate)).to_euler_angles()
+    new_translate = (rotation @ (entry.translate - pivot_point)) + pivot_point
+    if translation is not None:
+        new_translate += translation
+    entry.translate = new_translate
+
+
+def _batch_rigid_transform(
+    entries: list[BaseMSBPart | BaseMSBRegion],
+    rotation: Matrix3,
+    pivot_point: Vector3,
+    translation: Vector3 | None = None,
+):
+    """Equivalent to calling `_apply_rigid_transform` on each entry, but with all Euler angle conversions and matrix
+    products done as batched NumPy array operations.
+    """
+    if not entries:
+        return
+
+    translates = np.array([entry.translate.data for entry in entries], dtype=float)  # (n, 3)
+    # Many entries share the same Euler angles (e.g. axis-aligned map pieces), so the rotation is only computed once for
+    # each unique `rotate` and the results are broadcast back to all entries with `unique_indices`.
+    unique_eulers, unique_indices = np.unique(
+        np.array([entry.rotate.data for entry in entries], dtype=float), axis=0, return_inverse=True
+    )
+    unique_indices = unique_indices.reshape(-1)
+    eulers = np.radians(unique_eulers)  # (u, 3)
+    (sx, sy, sz), (cx, cy, cz) = np.sin(eulers).T, np.cos(eulers).T
+
+    # Build rotation matrices for FromSoft XZY order (`Ry @ Rz @ Rx`), as in `Matrix3.from_euler_angles`.
+    n = len(eulers)
+    rx = np.zeros((n, 3, 3))
+    rx[:, 0, 0] = 1.0
+    rx[:, 1, 1], rx[:, 1, 2], rx[:, 2, 1], rx[:, 2, 2] = cx, -sx, sx, cx
+    ry = np.zeros((n, 3, 3))
+    ry[:, 1, 1] = 1.0
+    ry[:, 0, 0], ry[:, 0, 2], ry[:, 2, 0], ry[:, 2, 2] = cy, sy, -sy, cy
+    rz = np.zeros((n, 3, 3))
+    rz[:, 2, 2] = 1.0
+    rz[:, 0, 0], rz[:, 0, 1], rz[:, 1, 0], rz[:, 1, 1] = cz, -sz, sz, cz
+    m = rotation.data @ (ry @ rz @ rx)
+
+    # Convert back to XZY Euler angles, as in `Matrix3.to_euler_angles`.
+    m10 = m[:, 1, 0]
+    new_x = np.arctan2(-m[:, 1, 2], m[:, 1, 1])
+    new_y = np.arctan2(-m[:, 2, 0], m[:, 0, 0])
+    new_z = np.arcsin(np.clip(m10, -1.0, 1.0))
+    gimbal_y = np.arctan2(m[:, 2, 1], m[:, 2, 2])
+    new_x[np.abs(m10) >= 1.0] = 0.0
+    new_y = np.where(m10 >= 1.0, gimbal_y, np.where(m10 <= -1.0, -gimbal_y, new_y))
+    new_z = np.where(m10 >= 1.0, np.pi / 2, np.where(m10 <= -1.0, -np.pi / 2, new_z))
+    new_rotates = np.degrees(np.stack((new_x, new_y, new_z), axis=1))[unique_indices]
+
+    pivot = pivot_point.data
+    new_translates = (translates - pivot) @ rotation.data.T + pivot
+    if translation is not None:
+        new_translates += translation.data
+
+    for entry, new_rotate, new_translate in zip(entries, new_rotates, new_translates):
+        entry.rotate = Vector3(new_rotate)
+        entry.translate = Vector3(new_translate)
 
 
 def rotate_part_or_region(
@@ -314,8 +461,7 @@ def rotate_part_or_region(
         )
     rotation = resolve_rotation(rotation, radians)
     pivot_point = Vector3(pivot_point)
-    entry.rotate = (rotation @ Matrix3.from_euler_angles(entry.rotate)).to_euler_angles()
-    entry.translate = (rotation @ (entry.translate - pivot_point)) + pivot_point
+    _apply_rigid_transform(entry, rotation, pivot_point)
 
 
 def rotate_all_in_world(
@@ -337,16 +483,15 @@ def rotate_all_in_world(
         selected_entries: if not empty, move only these given entries. Each element in this sequence can be
             an `MSBEntry` instance or the name (if unique) of a Part or Region.
     """
-    selected_entries = msb.resolve_entries_list(selected_entries, supertypes=("parts", "regions"))
+    selected_ids = _resolve_selected_ids(msb, selected_entries)
 
-    rotation_m = resolve_rotation(rotation)
+    rotation_m = resolve_rotation(rotation, radians)
     pivot_point = Vector3(pivot_point)
-    for part in msb.get_parts():
-        if not selected_entries or part in selected_entries:
-            rotate_part_or_region(part, rotation_m, pivot_point=pivot_point, radians=radians)
-    for region in msb.get_regions():
-        if not selected_entries or region in selected_entries:
-            rotate_part_or_region(region, rotation_m, pivot_point=pivot_point, radians=radians)
+    entries = [
+        entry for entry in (*msb.get_parts(), *msb.get_regions())
+        if not selected_ids or id(entry) in selected_ids
+    ]
+    _batch_rigid_transform(entries, rotation_m, pivot_point)
 
 
 def translate_all(msb: MSB, translate: Vector3, selected_entries=()):
@@ -360,13 +505,19 @@ def translate_all(msb: MSB, translate: Vector3, selected_entries=()):
         selected_entries: if not empty, move only these given entries. Each element in this sequence can be
             an `MSBEntry` instance or the name (if unique) of a Part or Region.
     """
-    selected_entries = msb.resolve_entries_list(selected_entries, supertypes=("parts", "regions"))
-
-    for part in msb.get_parts():
-        if not selected_entries or part in selected_entries:
-            part.translate += translate
-            if hasattr(part, "reflect_plane_height"):
-                part.reflect_plane_height += translate.y
+    selected_ids = _resolve_selected_ids(msb, selected_entries)
+
+    # Each entry gets a new `translate` vector, as entries may share the same `Vector3` instance.
+    translate_data = Vector3(translate).data
+    ty = float(translate_data[1])
+    collisions, other_parts = msb.get_collisions_and_other_parts()
+    for collision in collisions:
+        if not selected_ids or id(collision) in selected_ids:
+            collision.translate = Vector3(collision.translate.data + translate_data)
+            collision.reflect_plane_height += ty
+    for part in other_parts:
+        if not selected_ids or id(part) in selected_ids:
+            part.translate = Vector3(part.translate.data + translate_data)
     for region in msb.get_regions():
-        if not selected_entries or region in selected_entries:
-            region.translate += translate
+        if not selected_ids or id(region) in selected_ids:
+            region.translate = Vector3(region.translate.data + translate_data)
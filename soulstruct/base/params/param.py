@@ -8,6 +8,7 @@ import logging
 import struct
 import typing as tp
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from types import ModuleType
 
@@ -19,10 +20,13 @@ from soulstruct.utilities.binary import *
 from soulstruct.utilities.text import pad_chars
 from soulstruct.utilities.files import write_json
 
-from .param_row import ParamRow
+from .param_row import PARAM_VALUE_TYPING, ParamRow
 from .flags import ParamFlags1, ParamFlags2
 from .paramdef import ParamDef, ParamDefField, ParamDefBND, field_types as ft
 
+if tp.TYPE_CHECKING:
+    import numpy as np
+
 _LOGGER = logging.getLogger("soulstruct")
 
 
@@ -271,6 +275,52 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
     def field_names(self):
         return self.ROW_TYPE.get_binary_field_names()
 
+    def get_field_column(self, field_name: str) -> list[PARAM_VALUE_TYPING]:
+        """Get the value of field `field_name` (nickname or internal name) for every row, in row order.
+
+        Much faster than `[row[field_name] for row in param.values()]` for bulk scans over large params, as the field
+        name is resolved once rather than per row.
+        """
+        if self.ROW_TYPE is None:
+            return [row[field_name] for row in self.rows.values()]
+        if field_name not in self.ROW_TYPE.get_all_field_metadata():
+            for nickname, metadata in self.ROW_TYPE.get_all_field_metadata().items():
+                if metadata.internal_name == field_name:
+                    field_name = nickname
+                    break
+            else:
+                raise KeyError(f"No field with internal name or nickname '{field_name}' in {self.ROW_TYPE.__name__}.")
+        return list(map(attrgetter(field_name), self.rows.values()))
+
+    def get_field_array(self, field_name: str) -> np.ndarray:
+        """Get `get_field_column(field_name)` as a NumPy array, for vectorized inspection of one field across all rows
+        (e.g. `np.flatnonzero(fog_param.get_field_array("FogEndDistance") > 500.0)`).
+
+        Rows themselves are still stored as `ParamRow` objects; this is a one-off column copy in row order. Requires
+        `numpy`.
+        """
+        import numpy as np
+        return np.array(self.get_field_column(field_name))
+
+    def get_field_records(self, field_names: tp.Iterable[str] = None) -> np.ndarray:
+        """Get a NumPy structured array with one record per row (in row order), containing a leading 'RowID' column and
+        one typed column per field in `field_names` (default: all binary fields).
+
+        Like `get_field_array()`, this is a one-off copy for vectorized inspection of many fields at once (e.g.
+        `records[records["FogEndDistance"] > 500.0]["RowID"]`); edit the `ParamRow` objects themselves. Requires
+        `numpy`.
+        """
+        import numpy as np
+        if field_names is None:
+            field_names = self.field_names
+        columns = {"RowID": np.fromiter(self.rows, dtype=np.int64, count=len(self.rows))}
+        for field_name in field_names:
+            columns[field_name] = self.get_field_array(field_name)
+        records = np.empty(len(self.rows), dtype=[(name, column.dtype) for name, column in columns.items()])
+        for name, column in columns.items():
+            records[name] = column
+        return records
+
     # TODO: __repr__ method returns basic information about Param (but not entire row list).
 
     @classmethod
@@ -8,6 +8,7 @@ __all__ = [
     "ParamRow",
     "MAP_PARAM_TYPES",
     "PARAM_VALUE_TYPING",
+    "TOOLTIP_TODO",
     "ParamFieldMetadata",
     "ParamField",
     "ParamPad",
@@ -16,15 +17,19 @@ __all__ = [
 
 import abc
 import ast
+import copy
 import logging
+import struct
+import sys
 import typing as tp
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 from types import MappingProxyType
 
 from soulstruct.base.game_types import GAME_INT_TYPE
 from soulstruct.base.params.paramdef.field_types import base_type
 from soulstruct.utilities.binary import *
-from constrata.metadata import PRIMITIVE_FIELD_TYPING
+from constrata.metadata import PRIMITIVE_FIELD_TYPING, BinaryMetadata, BinaryStringMetadata
 
 _LOGGER = logging.getLogger("soulstruct")
 
@@ -42,6 +47,19 @@ class DynamicParamField(abc.ABC):
     # All types that could be returned by `__call__` for general validity checks.
     POSSIBLE_TYPES = set()
 
+    # Shared instances, keyed by subclass and constructor arguments (e.g. `ObjActSuccessCondition(1)`).
+    _INSTANCES: tp.ClassVar[dict[tuple, DynamicParamField]] = {}
+
+    def __new__(cls, *args, **kwargs):
+        """Instances are stateless apart from their constructor arguments, so each distinct set of arguments returns
+        the same singleton instance."""
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        try:
+            return DynamicParamField._INSTANCES[key]
+        except KeyError:
+            instance = DynamicParamField._INSTANCES[key] = super().__new__(cls)
+            return instance
+
     @abc.abstractmethod
     def __call__(self, data: ParamRow) -> tuple[PARAM_GAME_TYPE, str, str]:
         """Returns `(game_type, suffix, tooltip)` tuple based on the given `ParamRow` instance."""
@@ -87,10 +105,28 @@ class ParamRow(BinaryStruct):
 
     # Cached on first use. Maps binary field names (i.e. not including Name/RawName) to `ParamFieldMetadata` instances.
     _FIELD_PARAM_METADATA: tp.ClassVar[MappingProxyType[str, ParamFieldMetadata]] = None
+    # Cached on first use. Maps byte orders to a single `struct.Struct` that packs/unpacks every binary field of this
+    # row type in one call. Empty if any field needs individual handling (encoded strings, custom unpackers, etc.).
+    _FLAT_ROW_STRUCTS: tp.ClassVar[MappingProxyType[ByteOrder, struct.Struct]] = None
+    # Cached with `_FLAT_ROW_STRUCTS`. See `_compile_flat_row_fields()`.
+    _FLAT_ROW_FIELDS: tp.ClassVar[tuple[tuple[str, str, int, int, int, type], ...] | None] = None
+    _FLAT_ROW_HAS_BIT_FIELDS: tp.ClassVar[bool] = False
+    # Cached on first use. Maps binary field names to `(byte_offset, bit_offset)` within a packed row.
+    _FIELD_OFFSETS: tp.ClassVar[MappingProxyType[str, tuple[int, int]]] = None
+    # Cached on first use. Names of all fields (including `RawName` and `Name`) and a getter for all their values.
+    _STATE_FIELD_NAMES: tp.ClassVar[tuple[str, ...]] = None
+    _STATE_GETTER: tp.ClassVar[attrgetter] = None
 
     RawName: bytes = field(default=b"", metadata={"NOT_BINARY": True})
     Name: str = field(default="", metadata={"NOT_BINARY": True})
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__doc__ is None:
+            # Otherwise, `dataclass` builds a docstring from the full `inspect.signature()` of every generated paramdef
+            # class (often hundreds of fields), which is a large part of its per-class work at import.
+            cls.__doc__ = f"Row of a `{cls.__name__}` Param."
+
     def __iter__(self) -> tp.Iterator[tuple[str, PARAM_VALUE_TYPING]]:
         """Similar to `.items()`. Returns a tuple of `(name, value)` pairs."""
         return iter((field_name, getattr(self, field_name)) for field_name in self.get_binary_field_names())
@@ -135,7 +171,8 @@ class ParamRow(BinaryStruct):
         """Returns a mapping of all binary field names to their `ParamFieldMetadata` instances, constructed once on
         first call.
 
-        Uses annotated type hints to update `game_type` of metadata if not set explicitly in `ParamRow` subclass.
+        Uses annotated type hints to set `game_type` of metadata if not set explicitly in `ParamRow` subclass. Field
+        metadata is shared between identically declared fields, so a new instance is created in that case.
         """
         if cls._FIELD_PARAM_METADATA is None:
             field_types = tp.get_type_hints(cls)
@@ -144,7 +181,7 @@ class ParamRow(BinaryStruct):
                 metadata = f.metadata.get("param")  # type: ParamFieldMetadata  # must always exist
                 if not metadata.game_type:
                     # Set `game_type` from type hint if not set explicitly in `ParamRow` subclass.
-                    metadata.game_type = field_types[f.name]
+                    metadata = replace(metadata, game_type=field_types[f.name])
                 field_metadata[f.name] = metadata
             cls._FIELD_PARAM_METADATA = MappingProxyType(field_metadata)
 
@@ -154,6 +191,113 @@ class ParamRow(BinaryStruct):
     def get_field_metadata(cls, field_name: str) -> ParamFieldMetadata:
         return cls.get_all_field_metadata()[field_name]
 
+    @classmethod
+    def get_field_offsets(cls) -> MappingProxyType[str, tuple[int, int]]:
+        """Returns a mapping of all binary field names to their `(byte_offset, bit_offset)` within a packed row,
+        constructed once on first call. Row size is `get_size()`.
+
+        `bit_offset` is always zero for non-bit fields. Bit fields give the byte offset of their bit container, using
+        the same container layout as `BinaryStruct` (a bit field that overflows its container continues in the next).
+        Since these offsets are the same for every row of this type, single columns can be read straight from packed
+        row data with `struct.unpack_from`.
+        """
+        if cls._FIELD_OFFSETS is None:
+            cls.get_size()  # ensures all binary field metadata is finished
+            offsets = {}
+            offset = 0  # end of last field or bit container
+            bit_fmt = ""  # format of current bit container, if any
+            container_bits = used_bits = 0
+            for f in cls.get_binary_fields():
+                metadata = f.metadata["binary"]  # type: BinaryMetadata
+                size = struct.calcsize("<" + metadata.fmt)
+                if metadata.bit_count == -1:
+                    offsets[f.name] = (offset, 0)
+                    offset += size
+                    bit_fmt = ""
+                elif metadata.fmt != bit_fmt:
+                    # New bit container.
+                    offsets[f.name] = (offset, 0)
+                    offset += size
+                    bit_fmt = metadata.fmt
+                    container_bits = 8 * size
+                    used_bits = metadata.bit_count
+                elif used_bits + metadata.bit_count > container_bits:
+                    # Starts (if current container is full) or overflows into a new bit container.
+                    offsets[f.name] = (offset, 0) if used_bits == container_bits else (offset - size, used_bits)
+                    offset += size
+                    used_bits += metadata.bit_count - container_bits
+                else:
+                    offsets[f.name] = (offset - size, used_bits)
+                    used_bits += metadata.bit_count
+            cls._FIELD_OFFSETS = MappingProxyType(offsets)
+
+        return cls._FIELD_OFFSETS
+
+    @classmethod
+    def get_flat_row_struct(cls, byte_order: ByteOrder) -> struct.Struct | None:
+        """Returns a cached `struct.Struct` that packs/unpacks all binary fields of this row type, in order, with one
+        call. Consecutive bit fields share a single value in this struct (see `_FLAT_ROW_FIELDS`).
+
+        Returns `None` if any binary field cannot be unpacked directly from its format (e.g. encoded strings), in which
+        case the full `BinaryStruct` unpacking must be used.
+        """
+        if cls._FLAT_ROW_STRUCTS is None:
+            cls._FLAT_ROW_FIELDS = cls._compile_flat_row_fields()
+            if cls._FLAT_ROW_FIELDS is None:
+                cls._FLAT_ROW_STRUCTS = MappingProxyType({})
+            else:
+                cls._FLAT_ROW_HAS_BIT_FIELDS = any(flat_field[4] for flat_field in cls._FLAT_ROW_FIELDS)
+                full_fmt = "".join(flat_field[0] for flat_field in cls._FLAT_ROW_FIELDS)
+                cls._FLAT_ROW_STRUCTS = MappingProxyType(
+                    {byte_order: struct.Struct(byte_order.value + full_fmt) for byte_order in ByteOrder}
+                )
+        return cls._FLAT_ROW_STRUCTS.get(byte_order)
+
+    @classmethod
+    def _compile_flat_row_fields(cls) -> tuple[tuple[str, str, int, int, int, type], ...] | None:
+        """Get `(fmt, field_name, value_index, bit_offset, bit_mask, field_type)` for each binary field, or `None` if
+        this row type cannot use a flat struct. `bit_mask` (unshifted) is zero for non-bit fields.
+
+        `fmt` is empty for bit fields that continue the previous field's bit container (same format and enough bits
+        left), matching how `BinaryStruct` reads and writes them.
+        """
+        cls.get_size()  # ensures all binary field metadata is finished
+        flat_fields = []
+        value_index = -1
+        bit_fmt = ""  # format of current bit container, if any
+        used_bits = 0
+        for f in cls.get_binary_fields():
+            metadata = f.metadata["binary"]  # type: BinaryMetadata
+            if (
+                isinstance(metadata, BinaryStringMetadata)
+                or metadata.unpack_func not in {None, bytes}  # `bytes` pads are unpacked as-is
+                or metadata.pack_func is not None
+                or metadata.asserted
+                or metadata.should_skip_func is not None
+            ):
+                return None
+            if metadata.bit_count == -1:
+                value_index += 1
+                flat_fields.append((metadata.fmt, f.name, value_index, 0, 0, metadata.field_type))
+                bit_fmt = ""
+                continue
+            container_bits = 8 * struct.calcsize(metadata.fmt)
+            bit_mask = (1 << metadata.bit_count) - 1
+            if metadata.fmt == bit_fmt and used_bits + metadata.bit_count <= container_bits:
+                # Same bit container as previous field.
+                flat_fields.append(("", f.name, value_index, used_bits, bit_mask, metadata.field_type))
+                used_bits += metadata.bit_count
+            elif bit_fmt and metadata.fmt == bit_fmt:
+                return None  # bit field spills over its container, which `BinaryStruct` handles inconsistently
+            else:
+                value_index += 1
+                flat_fields.append((metadata.fmt, f.name, value_index, 0, bit_mask, metadata.field_type))
+                bit_fmt = metadata.fmt
+                used_bits = metadata.bit_count
+            if used_bits == container_bits:
+                bit_fmt = ""  # container is full
+        return tuple(flat_fields)
+
     def to_dict(
         self,
         ignore_pads=True,
@@ -215,6 +359,24 @@ class ParamRow(BinaryStruct):
     @classmethod
     def from_reader(cls, reader: BinaryReader, raw_name: bytes, name: str = "") -> ParamRow:
         """`name` may be empty if `raw_name` failed to decode (unfortunately does happen in some vanilla Params)."""
+        if (flat_struct := cls.get_flat_row_struct(reader.byte_order)) is not None:
+            # Fast path: unpack all fields with one call and pass them straight to `__init__`.
+            try:
+                values = reader.unpack_struct(flat_struct)
+            except Exception as ex:
+                raise ValueError(f"Could not read `ParamRow` of data type `{cls.__name__}`: {ex}")
+            if not cls._FLAT_ROW_HAS_BIT_FIELDS:
+                # noinspection PyArgumentList
+                return cls(RawName=raw_name, Name=name, **dict(zip(cls.get_binary_field_names(), values)))
+            field_values = {}
+            for _, field_name, value_index, bit_offset, bit_mask, field_type in cls._FLAT_ROW_FIELDS:
+                if not bit_mask:
+                    field_values[field_name] = values[value_index]
+                else:
+                    field_values[field_name] = field_type((values[value_index] >> bit_offset) & bit_mask)
+            # noinspection PyArgumentList
+            return cls(RawName=raw_name, Name=name, **field_values)
+
         try:
             row = cls.from_bytes(reader)
         except Exception as ex:
@@ -223,7 +385,38 @@ class ParamRow(BinaryStruct):
         row.Name = name
         return row
 
-    # `to_writer()` does not need overriding, as name is packed later.
+    def to_writer(
+        self,
+        writer: BinaryWriter = None,
+        reserve_obj=None,
+        byte_order: ByteOrder = None,
+        long_varints: bool = None,
+    ) -> BinaryWriter:
+        """Packs all fields with one flat `struct` call where possible. (Name is packed later by `Param`.)
+
+        Falls back to full `BinaryStruct` packing for complex row types, or for invalid field values so that its more
+        detailed errors are raised.
+        """
+        if writer is not None and reserve_obj is None and byte_order is None and long_varints is None:
+            flat_struct = self.get_flat_row_struct(writer.byte_order)
+            if flat_struct is not None:
+                values = []
+                try:
+                    for fmt, field_name, _, bit_offset, bit_mask, _ in self._FLAT_ROW_FIELDS:
+                        value = getattr(self, field_name)
+                        if bit_mask:
+                            if not 0 <= value <= bit_mask:
+                                raise ValueError  # handled below
+                            if not fmt:  # continues previous bit container
+                                values[-1] |= value << bit_offset
+                                continue
+                            value <<= bit_offset
+                        values.append(value)
+                    writer.append(flat_struct.pack(*values))
+                    return writer
+                except (TypeError, ValueError, struct.error):
+                    pass  # full packing below will raise an appropriate error
+        return super().to_writer(writer, reserve_obj, byte_order, long_varints)
 
     def get_packed_name(self, encoding: str) -> bytes:
         raw_name = self.Name.encode(encoding) if self.Name else self.RawName
@@ -233,6 +426,27 @@ class ParamRow(BinaryStruct):
             return b""  # zero offset for name
         return raw_stripped + terminator
 
+    @classmethod
+    def _get_state_getter(cls) -> attrgetter:
+        if cls._STATE_GETTER is None:
+            cls._STATE_FIELD_NAMES = tuple(f.name for f in cls.get_fields())
+            cls._STATE_GETTER = attrgetter(*cls._STATE_FIELD_NAMES)
+        return cls._STATE_GETTER
+
+    def __getstate__(self) -> tuple[PARAM_VALUE_TYPING, ...]:
+        """Rows are pickled and copied as one tuple of all field values (in field order), rather than the default
+        dictionary of every slot name to its value, which makes pickled `Param`s several times smaller."""
+        return self._get_state_getter()(self)
+
+    def __setstate__(self, state: tuple[PARAM_VALUE_TYPING, ...]):
+        self._get_state_getter()  # ensures `_STATE_FIELD_NAMES` is set
+        for field_name, value in zip(self._STATE_FIELD_NAMES, state, strict=True):  # e.g. state from other paramdef
+            setattr(self, field_name, value)
+
+    def __deepcopy__(self, memo) -> tp.Self:
+        # All field values are immutable, so there is nothing to copy deeply.
+        return copy.copy(self)
+
     def compare(self, other_row: ParamRow):
         """Prints each field that differs between the given `ParamRow` and this one (ignoring names)."""
         for field_name, field_value in iter(self):
@@ -241,17 +455,28 @@ class ParamRow(BinaryStruct):
                 print(f"  {field_name}: this = {field_value}, other = {other_value}")
 
 
-@dataclass(slots=True)
+# Placeholder tooltip for fields that have not been documented yet. Default for `ParamField`, so generated paramdef
+# modules can omit it.
+TOOLTIP_TODO = "TOOLTIP-TODO"
+
+
+@dataclass(slots=True, frozen=True)
 class ParamFieldMetadata:
-    """Not a `NamedTuple` as it may be modified with defaults."""
+    """Frozen, as instances are shared by all identically declared fields (see `_get_param_field_metadata()`)."""
     internal_name: str
     param_enum: type[base_type] = None
-    game_type: PARAM_GAME_TYPE = None  # NOTE: may be set by `ParamRow.get_all_field_metadata()` from type hint
+    game_type: PARAM_GAME_TYPE = None  # NOTE: may be resolved by `ParamRow.get_all_field_metadata()` from type hint
     hide: bool = False
     dynamic_callback: DynamicParamField | None = None
-    tooltip: str = "TOOLTIP-TODO"
+    tooltip: str = TOOLTIP_TODO
     is_pad: bool = False
 
+    def __post_init__(self):
+        # Many names and tooltips (e.g. 'pad[4]', 'Null padding (4 bytes).') repeat across thousands of param fields,
+        # and most are not automatically interned as they are not valid identifiers or are built with f-strings.
+        object.__setattr__(self, "internal_name", sys.intern(self.internal_name))
+        object.__setattr__(self, "tooltip", sys.intern(self.tooltip))
+
     def get_display_type(self) -> type:
         """Prefers `param_enum` to `game_type`, but redirects basic BOOL enums to Python `bool`."""
         if self.param_enum:
@@ -263,6 +488,28 @@ class ParamFieldMetadata:
         raise ValueError(f"Param field {self.internal_name} has no `param_enum` or `game_type`.")
 
 
+# Shared `ParamFieldMetadata` instances, keyed by constructor arguments. Thousands of fields across all paramdef modules
+# are declared identically (e.g. common pads, or the same field in DS1 PTDE and DSR).
+_PARAM_FIELD_METADATA = {}  # type: dict[tuple, ParamFieldMetadata]
+
+
+def _get_param_field_metadata(
+    internal_name: str,
+    param_enum: type[base_type] = None,
+    game_type: PARAM_GAME_TYPE = None,
+    hide: bool = False,
+    dynamic_callback: DynamicParamField | None = None,
+    tooltip: str = TOOLTIP_TODO,
+    is_pad: bool = False,
+) -> ParamFieldMetadata:
+    key = (internal_name, param_enum, game_type, hide, dynamic_callback, tooltip, is_pad)
+    try:
+        return _PARAM_FIELD_METADATA[key]
+    except KeyError:
+        metadata = _PARAM_FIELD_METADATA[key] = ParamFieldMetadata(*key)
+        return metadata
+
+
 def ParamField(
     field_type: type[PRIMITIVE_FIELD_TYPING],
     internal_name: str,
@@ -274,7 +521,7 @@ def ParamField(
     hide: bool = False,
     default: tp.Any = None,
     dynamic_callback: DynamicParamField | None = None,
-    tooltip: str = "TOOLTIP-TODO",
+    tooltip: str = TOOLTIP_TODO,
 ):
     """`dataclasses.field()` wrapper for defining `ParamRow` binary fields.
 
@@ -284,21 +531,19 @@ def ParamField(
     type.
     """
     if field_type is str:
-        metadata = BinaryString(fmt_or_byte_size=length, encoding=encoding)
+        metadata = BinaryString(fmt_or_byte_size=length, encoding=encoding)["metadata"]
     else:
-        metadata = Binary(fmt=field_type, bit_count=bit_count)
-    metadata["metadata"] |= {
-        "param": ParamFieldMetadata(
-            internal_name=internal_name,
-            param_enum=param_enum,
-            game_type=game_type,
-            hide=hide,
-            dynamic_callback=dynamic_callback,
-            tooltip=tooltip,
-        ),
-    }
-
-    return field(default=default, **metadata)
+        metadata = Binary(fmt=field_type, bit_count=bit_count)["metadata"]
+    # Added in place to the fresh metadata dictionary, as this is called for every field of every `ParamRow` class.
+    metadata["param"] = _get_param_field_metadata(
+        internal_name=internal_name,
+        param_enum=param_enum,
+        game_type=game_type,
+        hide=hide,
+        dynamic_callback=dynamic_callback,
+        tooltip=tooltip,
+    )
+    return field(default=default, metadata=metadata)
 
 
 def ParamPad(size: int, internal_name: str):
@@ -306,17 +551,15 @@ def ParamPad(size: int, internal_name: str):
     metadata = Binary(
         fmt=f"{size}s",
         # asserted=(b"\0" * size,),  # TODO: Finding non-null pad values...
+    )["metadata"]
+    metadata["param"] = _get_param_field_metadata(
+        internal_name=internal_name,
+        hide=True,
+        dynamic_callback=None,
+        tooltip=f"Null padding ({size} bytes).",
+        is_pad=True,
     )
-    metadata["metadata"] |= {
-        "param": ParamFieldMetadata(
-            internal_name=internal_name,
-            hide=True,
-            dynamic_callback=None,
-            tooltip=f"Null padding ({size} bytes).",
-            is_pad=True,
-        ),
-    }
-    return field(default=b"\0" * size, **metadata)
+    return field(default=b"\0" * size, metadata=metadata)
 
 
 def ParamBitPad(field_type: type[PRIMITIVE_FIELD_TYPING], internal_name: str, bit_count: int):
@@ -325,13 +568,11 @@ def ParamBitPad(field_type: type[PRIMITIVE_FIELD_TYPING], internal_name: str, bi
         fmt=field_type,
         bit_count=bit_count,
         # asserted=[0],  # TODO: Finding non-null pad values...
+    )["metadata"]
+    metadata["param"] = _get_param_field_metadata(
+        internal_name=internal_name,
+        hide=True,
+        dynamic_callback=None,
+        tooltip=f"Null padding ({bit_count} bits).",
     )
-    metadata["metadata"] |= {
-        "param": ParamFieldMetadata(
-            internal_name=internal_name,
-            hide=True,
-            dynamic_callback=None,
-            tooltip=f"Null padding ({bit_count} bits).",
-        ),
-    }
-    return field(default=0, **metadata)
+    return field(default=0, metadata=metadata)
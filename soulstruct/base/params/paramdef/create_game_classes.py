@@ -53,7 +53,7 @@ def create_paramdef_info(paramdefbnd: ParamDefBND, game_submodule, template_info
             except KeyError:
                 template_field = {}
             nickname = template_field.get("nickname", get_default_nickname(field_name))
-            tooltip = template_field.get("tooltip", "TOOLTIP-TODO")
+            tooltip = template_field.get("tooltip", TOOLTIP_TODO)
 
             paramdef_dict[field_name] = {"nickname": nickname, "tooltip": tooltip}
 
@@ -107,7 +107,7 @@ def create_game_classes(paramdefbnd: ParamDefBND, game_submodule: str, no_info:
             paramdef_info = paramdefbnd_info[paramdef_stem]
         except KeyError:
             paramdef_info = {
-                field_name: {"nickname": get_default_nickname(field_name), "tooltip": "TOOLTIP-TODO"}
+                field_name: {"nickname": get_default_nickname(field_name), "tooltip": TOOLTIP_TODO}
                 for field_name in paramdef.fields
             }
 
@@ -204,14 +204,15 @@ def create_game_classes(paramdefbnd: ParamDefBND, game_submodule: str, no_info:
             nickname = info["nickname"]
             args = ", ".join(field_args)
             tooltip = info["tooltip"]
-            if len(tooltip) < 100:
-                tooltip_lines = [tooltip]
-            else:
-                tooltip_lines = textwrap.wrap(tooltip, 100)
-            args += f",\n{ind}tooltip=\"{tooltip_lines[0]}"  # no closing quote
-            for line in tooltip_lines[1:]:
-                args += f" \"\n{ind}{ind}\"{line}"
-            args += "\""
+            if tooltip != TOOLTIP_TODO:  # default `ParamField` tooltip
+                if len(tooltip) < 100:
+                    tooltip_lines = [tooltip]
+                else:
+                    tooltip_lines = textwrap.wrap(tooltip, 100)
+                args += f",\n{ind}tooltip=\"{tooltip_lines[0]}"  # no closing quote
+                for line in tooltip_lines[1:]:
+                    args += f" \"\n{ind}{ind}\"{line}"
+                args += "\""
             line = f"    {nickname}: {field_type_name} = ParamField(\n{ind}{args},\n    )"
 
             lines.append(line)
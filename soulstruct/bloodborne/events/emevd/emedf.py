@@ -7,6 +7,7 @@ from __future__ import annotations
 import typing as tp
 
 from soulstruct.base.events.emevd.emedf import *
+from soulstruct.base.events.emevd.utils import get_item_type
 from soulstruct.darksouls1ptde.events.emevd.emedf import EMEDF as PTDE_EMEDF
 from soulstruct.bloodborne.maps.constants import get_map_variable_name
 from soulstruct.bloodborne.game_types import *
@@ -63,7 +64,7 @@ GAME_MAP_EVS = {
 }
 ITEM_TYPE = {
     "type": ItemType,
-    "default": lambda args: args["item"].get_item_enum(),
+    "default": lambda args: get_item_type(args["item"]),
     "comment": "Auto-detected from `item` type by default.",
 }
 FLAG = {
@@ -1468,46 +1469,7 @@ EMEDF = PTDE_EMEDF | {
             ),
         },
     },
-    (1003, 7): {
-        "alias": "SkipLinesIfMapPresenceState",
-        "docstring": "TODO",
-        "args": {
-            "line_count": INT | HIDE_NAME,
-            "state": BOOL | HIDE_NAME,
-            "area_id": AREA_ID,
-            "block_id": BLOCK_ID,
-        },
-        "evs_args": {
-            "line_count": {},
-            "state": {},
-            "game_map": GAME_MAP_EVS,
-        },
-        "partials": {
-            "SkipLinesIfInsideMap": dict(state=True),
-            "SkipLinesIfOutsideMap": dict(state=False),
-        },
-    },
-    (1003, 8): {
-        "alias": "ReturnIfMapPresenceState",
-        "docstring": "TODO",
-        "args": {
-            "event_return_type": EVENT_RETURN_TYPE,
-            "state": BOOL | HIDE_NAME,
-            "area_id": AREA_ID,
-            "block_id": BLOCK_ID,
-        },
-        "evs_args": {
-            "event_return_type": {},
-            "state": {},
-            "game_map": GAME_MAP_EVS,
-        },
-        "partials": {
-            "EndIfInsideMap": dict(event_return_type=EventReturnType.End, state=True),
-            "EndIfOutsideMap": dict(event_return_type=EventReturnType.End, state=False),
-            "RestartIfInsideMap": dict(event_return_type=EventReturnType.Restart, state=True),
-            "RestartIfOutsideMap": dict(event_return_type=EventReturnType.Restart, state=False),
-        },
-    },
+    # (1003, 7) and (1003, 8) updated below.
     (1005, 0): {
         "alias": "AwaitObjectDestructionState",
         "docstring": "TODO",
@@ -38,7 +38,7 @@ import logging
 import typing as tp
 
 from soulstruct.base.events.evs.compiler import EVSInstructionCompiler, BooleanTestCompiler
-from soulstruct.base.events.emevd.utils import get_coord_entity_type
+from soulstruct.base.events.emevd.utils import get_coord_entity_type, get_item_type
 from soulstruct.darksouls1ptde.game_types import *
 
 from ..enums import *
@@ -54,6 +54,30 @@ _LOGGER = logging.getLogger("soulstruct")
 # (Such functions should still appear in the PYI module for intelli-sense.)
 COMPILER = EVSInstructionCompiler(EMEDF_ALIASES)
 
+# Boolean tests for `GameObjectInt` types, built once here rather than on every `compile_game_object_test()` call.
+_FLAG_TEST = BooleanTestCompiler(COMPILER).set_all("FlagEnabled", "FlagDisabled")
+_REGION_TEST = BooleanTestCompiler(COMPILER, if_true="IfPlayerInsideRegion", if_false="IfPlayerOutsideRegion")
+_OBJECT_TEST = BooleanTestCompiler(COMPILER).set_all("ObjectNotDestroyed", "ObjectDestroyed")  # True == NOT destroyed
+_CHARACTER_TEST = BooleanTestCompiler(COMPILER, if_true="IfCharacterAlive", if_false="IfCharacterDead")
+_OBJ_ACT_TEST = BooleanTestCompiler(COMPILER, if_true="IfObjectActivated")
+
+# Resolved test for each `GameObjectInt` subclass, filled by `compile_game_object_test()` on first use of the class.
+_GAME_OBJECT_TESTS = {}  # type: dict[GAME_INT_TYPE, BooleanTestCompiler]
+
+
+def _get_game_object_test(game_object_int_type: GAME_INT_TYPE) -> BooleanTestCompiler:
+    if issubclass(game_object_int_type, Flag):
+        return _FLAG_TEST
+    if issubclass(game_object_int_type, Region):
+        return _REGION_TEST
+    if issubclass(game_object_int_type, Object):
+        return _OBJECT_TEST
+    if issubclass(game_object_int_type, Character):
+        return _CHARACTER_TEST
+    if issubclass(game_object_int_type, ObjActEvent):
+        return _OBJ_ACT_TEST
+    raise TypeError(f"Type `{game_object_int_type.__name__}` cannot be used as a boolean directly in EVS script.")
+
 
 def compile_game_object_test(
     game_object_int_type: GAME_INT_TYPE,
@@ -64,27 +88,15 @@ def compile_game_object_test(
     end_event=False,
     restart_event=False,
 ) -> list[str]:
-    test = BooleanTestCompiler(COMPILER)
-
-    if issubclass(game_object_int_type, Flag):
-        test.set_all("FlagEnabled", "FlagDisabled")
-    elif issubclass(game_object_int_type, Region):
-        if game_object_int_type.__name__ == "RegionPoints":
-            _LOGGER.warning(
-                f"Used a member of an enum called `RegionPoints` as a boolean test for being inside or outside "
-                f"a Region, which will not work for volumeless points."
-            )
-        test.if_true = "IfPlayerInsideRegion"
-        test.if_false = "IfPlayerOutsideRegion"
-    elif issubclass(game_object_int_type, Object):
-        test.set_all("ObjectNotDestroyed", "ObjectDestroyed")  # True == object NOT destroyed
-    elif issubclass(game_object_int_type, Character):
-        test.if_true = "IfCharacterAlive"
-        test.if_false = "IfCharacterDead"
-    elif issubclass(game_object_int_type, ObjActEvent):
-        test.if_true = "IfObjectActivated"
-    else:
-        raise TypeError(f"Type `{game_object_int_type.__name__}` cannot be used as a boolean directly in EVS script.")
+    try:
+        test = _GAME_OBJECT_TESTS[game_object_int_type]
+    except KeyError:
+        test = _GAME_OBJECT_TESTS[game_object_int_type] = _get_game_object_test(game_object_int_type)
+    if test is _REGION_TEST and game_object_int_type.__name__ == "RegionPoints":
+        _LOGGER.warning(
+            f"Used a member of an enum called `RegionPoints` as a boolean test for being inside or outside "
+            f"a Region, which will not work for volumeless points."
+        )
 
     return test.compile_object(
         game_object,
@@ -306,76 +318,84 @@ def Move(
     )
 
 
+# Indexed by `including_storage`.
+_ITEM_STATE_INSTRUCTIONS = ("IfPlayerItemStateExcludingStorage", "IfPlayerItemStateIncludingStorage")
+
+
+def _compile_item_state(
+    condition: int, state: bool, item: ItemTyping, item_type: ItemType | None, including_storage: bool
+) -> list[str]:
+    """Compile the storage-excluding or storage-including item state test, detecting `item_type` if not given."""
+    if item_type is None:
+        item_type = get_item_type(item)
+    return COMPILER.base_compile_instruction(
+        _ITEM_STATE_INSTRUCTIONS[bool(including_storage)],
+        condition=condition,
+        item_type=item_type,
+        item=item,
+        state=state,
+    )
+
+
 @COMPILER.add_custom_instruction
 def IfPlayerItemState(
     condition: int, state: bool, item: ItemTyping, item_type: ItemType = None, including_storage: bool = False
 ):
     """My wrapper for the two versions that do and do not include storage (e.g., Bottomless Box) in the test."""
-    if item_type is None:
-        try:
-            item_type = item.get_item_enum()
-        except AttributeError:
-            raise AttributeError("Item type not detected. Use keyword or typed item.")
-    if including_storage:
-        return COMPILER.compile(
-            "IfPlayerItemStateIncludingStorage", condition=condition, item_type=item_type, item=item, state=state
-        )
-    return COMPILER.compile(
-        "IfPlayerItemStateExcludingStorage", condition=condition, item_type=item_type, item=item, state=state
-    )
+    return _compile_item_state(condition, state, item, item_type, including_storage)
 
 
 # region `IfPlayerItemState` partials
 @COMPILER.add_custom_instruction
 def IfPlayerHasItem(condition: int, item: ItemTyping, item_type: ItemType = None, including_storage: bool = False):
-    return IfPlayerItemState(condition, True, item, item_type, including_storage)
+    return _compile_item_state(condition, True, item, item_type, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerHasWeapon(condition: int, weapon: WeaponTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, True, weapon, ItemType.Weapon, including_storage)
+    return _compile_item_state(condition, True, weapon, ItemType.Weapon, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerHasArmor(condition: int, armor: ArmorTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, True, armor, ItemType.Armor, including_storage)
+    return _compile_item_state(condition, True, armor, ItemType.Armor, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerHasRing(condition: int, ring: AccessoryTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, True, ring, ItemType.Ring, including_storage)
+    return _compile_item_state(condition, True, ring, ItemType.Ring, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerHasGood(condition: int, good: GoodTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, True, good, ItemType.Good, including_storage)
+    return _compile_item_state(condition, True, good, ItemType.Good, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerDoesNotHaveItem(
     condition: int, item: ItemTyping, item_type: ItemType = None, including_storage: bool = False
 ):
-    return IfPlayerItemState(condition, False, item, item_type, including_storage)
+    return _compile_item_state(condition, False, item, item_type, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerDoesNotHaveWeapon(condition: int, weapon: WeaponTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, False, weapon, ItemType.Weapon, including_storage)
+    return _compile_item_state(condition, False, weapon, ItemType.Weapon, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerDoesNotHaveArmor(condition: int, armor: ArmorTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, False, armor, ItemType.Armor, including_storage)
+    return _compile_item_state(condition, False, armor, ItemType.Armor, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerDoesNotHaveRing(condition: int, ring: AccessoryTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, False, ring, ItemType.Ring, including_storage)
+    return _compile_item_state(condition, False, ring, ItemType.Ring, including_storage)
 
 
 @COMPILER.add_custom_instruction
 def IfPlayerDoesNotHaveGood(condition: int, good: GoodTyping, including_storage: bool = False):
-    return IfPlayerItemState(condition, False, good, ItemType.Good, including_storage)
+    return _compile_item_state(condition, False, good, ItemType.Good, including_storage)
 # endregion
 
 
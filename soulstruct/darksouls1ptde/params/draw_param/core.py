@@ -9,6 +9,8 @@ from soulstruct.base.params.param import Param
 from soulstruct.base.params.param_row import ParamRow
 from soulstruct.dcx import DCXType
 
+_TYPED_DRAW_PARAM_CLASSES = {}  # type: dict[type[ParamRow], type[DrawParam]]
+
 
 class DrawParam(Param):
     """`Param` with some extra methods that are specific to DrawParam tables."""
@@ -19,27 +21,28 @@ class DrawParam(Param):
     def get_nonzero_entries(self, ignore_polyg=True):
         """Filters table entries and returns only those with a non-empty name that does not start with '0' (or,
         by default, 'PolyG', which I assume is cutscene-specific lighting). """
-        if ignore_polyg:
-            return {
-                index: row for index, row in self.rows.items() if row.Name and not row.Name.startswith("0")
-            }
+        # Only the first five characters are lowered (not a full copy of every name) for the 'PolyG' check.
         return {
             index: row
             for index, row in self.rows.items()
-            if row.Name and not row.Name.startswith("0") and not row.Name.lower().startswith("polyg")
+            if (name := row.Name) and name[0] != "0" and not (ignore_polyg and name[:5].lower() == "polyg")
         }
 
 
 def TypedDrawParam(data_type: type[ParamRow]):
     """Generate a `Param` subclass dynamically with the given row type (or retrieve correct existing subclass).
 
+    Classes are cached by row type, so each is generated (or found) only once.
+
     TODO: Add game-appropriate DCX (probably `Null`).
-    TODO: Cache classes so they aren't generated more than once.
     """
+    if data_type in _TYPED_DRAW_PARAM_CLASSES:
+        return _TYPED_DRAW_PARAM_CLASSES[data_type]
     for draw_param_subclass in DrawParam.__subclasses__():
         if draw_param_subclass.__name__ == "ParamDict":
             continue
         if draw_param_subclass.ROW_TYPE is data_type:
+            _TYPED_DRAW_PARAM_CLASSES[data_type] = draw_param_subclass
             return draw_param_subclass
     # noinspection PyTypeChecker
     new_draw_param_subclass = types.new_class(
@@ -48,4 +51,5 @@ def TypedDrawParam(data_type: type[ParamRow]):
     )  # type: type[DrawParam]
     new_draw_param_subclass.ROW_TYPE = data_type
     new_draw_param_subclass.__module__ = DrawParam.__module__
+    _TYPED_DRAW_PARAM_CLASSES[data_type] = new_draw_param_subclass
     return new_draw_param_subclass
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-__all__ = ["DrawParamDirectory"]
+__all__ = ["DrawParamDirectory", "get_draw_param_area"]
 
 import abc
 import logging
@@ -19,6 +19,20 @@ def drawparambnd_property(area_name: str):
     return property(lambda self: self.files[f"{area_name}_DrawParam"])
 
 
+def get_draw_param_area(draw_param_stem: str, draw_param_areas: tp.Container[str]) -> str:
+    """Get area name ('aXX' or 'default') from 'mXX' name, 'aXX' name, or 'default', with or without '_DrawParam'
+    suffix (and any file extensions).
+
+    Raises a `ValueError` if the area name is not in `draw_param_areas`.
+    """
+    area_name = draw_param_stem.split(".")[0].removesuffix("_DrawParam")
+    if area_name.startswith("m"):
+        area_name = "a" + area_name[1:]
+    if area_name not in draw_param_areas:
+        raise ValueError(f"Invalid DrawParam area name: {draw_param_stem}")
+    return area_name
+
+
 class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
 
     FILE_NAME_PATTERN: tp.ClassVar[str] = r"(a\d\d|default)_DrawParam\.parambnd"
@@ -57,17 +71,20 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
 
     def get_drawparambnd(self, draw_param_stem: str) -> DrawParamBND:
         """Get `DrawParamBND` by 'mXX' name, 'aXX' name, or 'default', with or without '_DrawParam' suffix."""
-        draw_param_stem = draw_param_stem.split(".")[0]
-        if draw_param_stem == "default":
-            return self.files["default_DrawParam"]
-        if draw_param_stem.startswith("m"):
-            draw_param_stem = "a" + draw_param_stem[1:]
-        if draw_param_stem in self.DRAW_PARAM_AREAS:
-            return self.files[f"{draw_param_stem}_DrawParam"]
-        raise KeyError(f"Invalid `DrawParamBND` in this `DrawParamDirectory`: {draw_param_stem}")
+        try:
+            area_name = get_draw_param_area(draw_param_stem, self.DRAW_PARAM_AREAS)
+        except ValueError:
+            raise KeyError(f"Invalid `DrawParamBND` in this `DrawParamDirectory`: {draw_param_stem}")
+        return self.files[f"{area_name}_DrawParam"]
 
     @classmethod
-    def from_path(cls, directory_path: Path | str):
+    def from_path(cls, directory_path: Path | str, area_names: tp.Iterable[str] = None):
+        """Load all `DrawParamBND` files in `directory_path`.
+
+        If `area_names` is given (e.g. `("m15", "default")`), only the `DrawParamBND`s of those areas are read and
+        unpacked; the other files are skipped without reading them. Useful when only some areas' lighting is needed.
+        Names are interpreted as in `get_drawparambnd()`, and a `ValueError` is raised for any unknown area name.
+        """
         # NOTE: Pattern is still used in combination with `Map` stems.
         if cls.FILE_NAME_PATTERN is None or cls.FILE_CLASS is None:
             raise TypeError(
@@ -80,6 +97,13 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
             raise NotADirectoryError(f"Missing directory: {directory_path}")
 
         all_bnd_stems = cls.get_all_file_stems()
+        skipped_bnd_stems = set()
+        if area_names is not None:
+            requested_bnd_stems = {
+                f"{get_draw_param_area(area_name, cls.DRAW_PARAM_AREAS)}_DrawParam" for area_name in area_names
+            }
+            skipped_bnd_stems = set(all_bnd_stems) - requested_bnd_stems
+            all_bnd_stems = [stem for stem in all_bnd_stems if stem in requested_bnd_stems]
 
         files = {}
         file_name_re = re.compile(cls.FILE_NAME_PATTERN + r"(\.dcx)?$")
@@ -89,6 +113,8 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
                 if file_stem in all_bnd_stems:
                     files[file_stem] = cls.FILE_CLASS.from_path(file_path)
                     all_bnd_stems.remove(file_stem)
+                elif file_stem in skipped_bnd_stems:
+                    continue  # not requested
                 else:
                     _LOGGER.warning(
                         f"Ignoring file with unrecognized area stem in `{cls.__name__}` directory: {file_path.name}"
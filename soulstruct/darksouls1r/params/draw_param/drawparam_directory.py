@@ -11,6 +11,7 @@ from dataclasses import field
 from pathlib import Path
 
 from soulstruct.base.game_file_directory import GameFileDirectory
+from soulstruct.darksouls1ptde.params.draw_param.drawparam_directory import get_draw_param_area
 from .drawparambnd import DrawParamBND
 
 _LOGGER = logging.getLogger("soulstruct")
@@ -58,17 +59,20 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
 
     def get_drawparambnd(self, draw_param_stem: str) -> DrawParamBND:
         """Get `DrawParamBND` by 'mXX' name, 'aXX' name, or 'default', with or without '_DrawParam' suffix."""
-        draw_param_stem = draw_param_stem.split(".")[0]
-        if draw_param_stem == "default":
-            return self.files["default_DrawParam"]
-        if draw_param_stem.startswith("m"):
-            draw_param_stem = "a" + draw_param_stem[1:]
-        if draw_param_stem in self.DRAW_PARAM_AREAS:
-            return self.files[f"{draw_param_stem}_DrawParam"]
-        raise KeyError(f"Invalid `DrawParamBND` in this `DrawParamDirectory`: {draw_param_stem}")
+        try:
+            area_name = get_draw_param_area(draw_param_stem, self.DRAW_PARAM_AREAS)
+        except ValueError:
+            raise KeyError(f"Invalid `DrawParamBND` in this `DrawParamDirectory`: {draw_param_stem}")
+        return self.files[f"{area_name}_DrawParam"]
 
     @classmethod
-    def from_path(cls, directory_path: Path | str):
+    def from_path(cls, directory_path: Path | str, area_names: tp.Iterable[str] = None):
+        """Load all `DrawParamBND` files in `directory_path`.
+
+        If `area_names` is given (e.g. `("m15", "default")`), only the `DrawParamBND`s of those areas are read and
+        unpacked; the other files are skipped without reading them. Useful when only some areas' lighting is needed.
+        Names are interpreted as in `get_drawparambnd()`, and a `ValueError` is raised for any unknown area name.
+        """
         # NOTE: Pattern is still used in combination with `Map` stems.
         if cls.FILE_NAME_PATTERN is None or cls.FILE_CLASS is None:
             raise TypeError(
@@ -81,6 +85,13 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
             raise NotADirectoryError(f"Missing directory: {directory_path}")
 
         all_bnd_stems = cls.get_all_file_stems()
+        skipped_bnd_stems = set()
+        if area_names is not None:
+            requested_bnd_stems = {
+                f"{get_draw_param_area(area_name, cls.DRAW_PARAM_AREAS)}_DrawParam" for area_name in area_names
+            }
+            skipped_bnd_stems = set(all_bnd_stems) - requested_bnd_stems
+            all_bnd_stems = [stem for stem in all_bnd_stems if stem in requested_bnd_stems]
 
         # noinspection PyTypeChecker
         files = {}  # type: dict[str, DrawParamBND]
@@ -92,6 +103,8 @@ class DrawParamDirectory(GameFileDirectory[DrawParamBND], abc.ABC):
                     # noinspection PyTypeChecker
                     files[file_stem] = cls.FILE_CLASS.from_path(file_path)  # type: DrawParamDirectory
                     all_bnd_stems.remove(file_stem)
+                elif file_stem in skipped_bnd_stems:
+                    continue  # not requested
                 else:
                     _LOGGER.warning(
                         f"Ignoring file with unrecognized area stem in `{cls.__name__}` directory: {file_path.name}"
@@ -1664,7 +1664,7 @@ class FEV(GameFile):
             fsb = open_fsbs.setdefault(str(fsb_path), FSB(fsb_path))
             if write_bank_dir:
                 write_bank_dir.mkdir(parents=True, exist_ok=True)
-                fsbext(f"\"{fsb_path}\"", f"-d \"{str(write_bank_dir)}\"")
+                fsbext(fsb_path, ("-d", str(write_bank_dir)))
 
             if len(fsb.samples) > 0:
                 # Try to determined bank file format from first sample.
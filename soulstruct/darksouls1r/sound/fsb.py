@@ -25,12 +25,16 @@ __all__ = ["FSB", "FSBSample", "FSBSampleHeader", "FSBHeaderVersion", "FSBHeader
 _LOGGER = logging.getLogger("soulstruct")
 
 
-def fsbext(fsb_path: Path | str, options=""):
-    """Call `fsbext.exe` with given options on `fsb_path`."""
+def fsbext(fsb_path: Path | str, options: tp.Sequence[str] = ()):
+    """Call `fsbext.exe` with given options on `fsb_path`.
+
+    Each option (or option value, e.g. an output directory) should be a separate string, without quotes, as the
+    arguments are passed to the executable directly rather than parsed from a command line string.
+    """
     executable = PACKAGE_PATH("darksouls1r/sound/fsbext.exe")
     if not executable.is_file():
         raise FileNotFoundError("`fsbext.exe` is missing from Soulstruct package. Cannot extract FSB file.")
-    sp.call(f"{executable} {options} {fsb_path}")
+    sp.call([str(executable), *options, str(fsb_path)])
 
 
 def tag(tag_name: str, value: tp.Any = ""):
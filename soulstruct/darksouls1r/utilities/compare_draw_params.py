@@ -1,7 +1,31 @@
 """Script that compares an arbitrary number of DrawParam parameters."""
+from __future__ import annotations
+
+import typing as tp
+
+from soulstruct.base.params.param_row import ParamRow
 from soulstruct.darksouls1r.params.draw_param import DrawParamDirectory
 
 
+def iter_row_matches(
+    active_params: tp.Sequence[dict[int, ParamRow]], names: tp.Sequence[str]
+) -> tp.Iterator[tuple[int, list[ParamRow], list[str]]]:
+    """Yield `(row_id, entries, missing_entries)` for every row ID present in at least one of `active_params`, in
+    ascending order. `entries` are the rows with that ID and `missing_entries` are the `names` of tables without it.
+
+    Only row IDs present in at least one table are visited, rather than every integer up to the largest ID.
+    """
+    for i in sorted(set().union(*active_params)):
+        entries = []
+        missing_entries = []
+        for j, ap in enumerate(active_params):
+            if i in ap:
+                entries.append(ap[i])
+            else:
+                missing_entries.append(names[j])
+        yield i, entries, missing_entries
+
+
 def compare_draw_params(
     draw_params_one: DrawParamDirectory,
     draw_params_two: DrawParamDirectory,
@@ -45,27 +69,7 @@ def compare_draw_params(
                     else:
                         active_params.append(dt[slot].get_nonzero_entries())
                         slots.append(slot)
-                combined_entries = []
-                for ap in active_params:
-                    combined_entries.extend(list(ap.keys()))
-                if not combined_entries:
-                    # All empty.
-                    continue
-                for i in range(max(combined_entries)):
-                    entries = []
-                    missing_entries = []
-                    for j, ap in enumerate(active_params):
-                        try:
-                            entry = ap[i]
-                        except KeyError:
-                            missing_entries.append(names[j])
-                        else:
-                            entries.append(entry)
-
-                    if not entries:
-                        # No DrawParam has an entry with this ID.
-                        continue
-
+                for i, entries, missing_entries in iter_row_matches(active_params, names):
                     if missing_entries:
                         if not map_printed:
                             print(f"\n\n{map_name}:")
@@ -8,8 +8,8 @@ __all__ = [
 ]
 
 import copy
+import functools
 import logging
-import pickle
 import struct
 import typing as tp
 from types import MappingProxyType
@@ -17,7 +17,6 @@ from types import MappingProxyType
 from soulstruct.darksouls1r.params import Param, GameParamBND, ParamRow
 from soulstruct.utilities.binary import ByteOrder
 from soulstruct.utilities.memory import *
-from soulstruct.utilities.files import PACKAGE_PATH
 
 if tp.TYPE_CHECKING:
     from soulstruct.darksouls1r.params.draw_param import DrawParam
@@ -156,12 +155,17 @@ class DSRMemoryHook(MemoryHook):
         "current_map": MemoryValue("CURRENT_MAP", (0xA20,), 4, "<BBBB"),  # (dd, cc, bb, aa)
     }
 
-    @memory_hook_validate
     def get_event_flag_offset_mask(self, flag_id: int) -> tuple[int, int]:
         """Returns offset and bit mask of given flag ID.
 
         Raises a ValueError if the flag ID is not valid.
         """
+        return self._get_event_flag_offset_mask(flag_id)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_event_flag_offset_mask(cls, flag_id: int) -> tuple[int, int]:
+        """Offset and mask only depend on the flag ID (and class tables), not on game memory, so they are cached."""
         id_string = f"{flag_id:0>8}"
         if len(id_string) > 8:
             raise ValueError(f"Invalid flag ID (too large): {id_string}")
@@ -170,13 +174,13 @@ class DSRMemoryHook(MemoryHook):
         section = int(id_string[4:5])  # fifth digit
         number = int(id_string[5:8])  # sixth, seventh, eighth digits
 
-        if group not in self.EVENT_FLAG_GROUPS:
+        if group not in cls.EVENT_FLAG_GROUPS:
             raise ValueError(f"Invalid flag ID (invalid group): {id_string}")
-        if area not in self.EVENT_FLAG_AREAS:
+        if area not in cls.EVENT_FLAG_AREAS:
             raise ValueError(f"Invalid flag ID (invalid area): {id_string}")
 
-        offset = self.EVENT_FLAG_GROUPS[group]
-        offset += self.EVENT_FLAG_AREAS[area] * 0x500
+        offset = cls.EVENT_FLAG_GROUPS[group]
+        offset += cls.EVENT_FLAG_AREAS[area] * 0x500
         offset += section * 128
         offset += (number - (number % 32)) // 8
 
@@ -221,6 +225,7 @@ class DSRMemoryHook(MemoryHook):
         """Find and cache addresses of given `Param` to avoid doing it lazily at write time."""
         if not param.path:
             raise ValueError("Param must have `path` set to cache its memory address.")
+        self.load_address_cache()
         if not force_recache and param.path.name in self._address_cache.get("ds1r", {}):
             return  # already cached; will not replace
         self.get_param_address(param.path.name, param.param_type)
@@ -280,7 +285,7 @@ class DSRMemoryHook(MemoryHook):
             raise MemoryError(f"Could not find memory address of Param '{param_file_name}' table in game memory.")
         # print(f"{param_file_name} string offset address: {hex(string_offset_address)}")
         data_address = self.read(string_offset_address + 56, 8, "q")
-        self._address_cache.setdefault("ds1r", {})[param_file_name] = data_address
+        self.set_cached_address("ds1r", param_file_name, data_address)
         return data_address
 
     @memory_hook_validate
@@ -295,11 +300,7 @@ class DSRMemoryHook(MemoryHook):
         if len(param_file_names) != len(param_types):
             raise ValueError("Number of param file names and paramdef names to scan for must match.")
 
-        try:
-            with PACKAGE_PATH("__address_cache__").open("rb") as f:
-                self._address_cache = pickle.load(f)
-        except (FileNotFoundError, EOFError, ValueError):
-            self._address_cache = {}
+        self.load_address_cache()
 
         params_to_find = list(param_file_names)
         param_addresses = {param_file_name: None for param_file_name in param_file_names}
@@ -344,10 +345,9 @@ class DSRMemoryHook(MemoryHook):
                 raise MemoryError(f"Could not find memory address of Param '{param_file_name}' table in game memory.")
             else:
                 param_addresses[param_file_name] = self.read(offset_address + 56, 8, "q")
-                self._address_cache.setdefault("ds1r", {})[param_file_name] = param_addresses[param_file_name]
+                self.set_cached_address("ds1r", param_file_name, param_addresses[param_file_name])
 
-        with PACKAGE_PATH("__address_cache__").open("wb") as f:
-            pickle.dump(self._address_cache, f)
+        self.save_address_cache()
 
         return param_addresses
 
@@ -392,6 +392,8 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
     PARAM_ROW_COUNT_OFFSET = 0xA
     # Offset in Param where row pointer structs begin (i.e. header size).
     PARAM_ROW_POINTER_OFFSET = 0x30
+    # Row pointer struct: row ID, data offset, name offset.
+    _ROW_POINTER_STRUCT = struct.Struct("<iii")
 
     # Maps DrawParam types to their pointer offsets in the DrawParam manager struct.
     POINTER_OFFSETS = {
@@ -449,6 +451,7 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
         """
         if not self.hook.try_hooked():
             _LOGGER.warning(f"Cannot read DrawParam `{self.draw_param_file_stem}` from unhooked memory.")
+            return  # cannot read
 
         param_data_address = self._get_param_data_address()
         if param_data_address == 0:
@@ -460,6 +463,7 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
         """Write current `row_dict` to memory."""
         if not self.hook.try_hooked():
             _LOGGER.warning(f"Cannot write DrawParam `{self.draw_param_file_stem}` to unhooked memory.")
+            return  # cannot write
 
         if not self.row_dict:
             raise RuntimeError(
@@ -498,11 +502,8 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
         _LOGGER.info(f"Reading {row_count} rows from memory for Param {self.draw_param_stem}.")
 
         row_dict = {}
-        param_row_ptr_address = param_data_address + self.PARAM_ROW_POINTER_OFFSET  # first row pointer
-        for i in range(row_count):
-            row_id = self.hook.read_int32(param_row_ptr_address + i * 12 + 0)
-            data_offset = self.hook.read_int32(param_row_ptr_address + i * 12 + 4)
-            name_offset = self.hook.read_int32(param_row_ptr_address + i * 12 + 8)
+        row_size = self.draw_param_row_type.get_size()
+        for row_id, data_offset, name_offset in self._read_row_pointers(param_data_address, row_count):
             raw_name = self.hook.read_z_bytes(param_data_address + name_offset)
             if raw_name:
                 _LOGGER.debug(f"Loaded {self.draw_param_stem} row {row_id} with RawName: {raw_name}")
@@ -510,7 +511,7 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
                 name = raw_name.decode("shift_jis_2004")
             except UnicodeDecodeError:
                 name = ""  # cannot decode
-            row_data = self.hook.read(param_data_address + data_offset, size=self.draw_param_row_type.get_size())
+            row_data = self.hook.read(param_data_address + data_offset, size=row_size)
             row_dict[row_id] = self.draw_param_row_type.from_reader(row_data, raw_name=raw_name, name=name)
         return row_dict
 
@@ -523,16 +524,24 @@ class MemoryDrawParam(tp.Generic[PARAM_ROW_DATA_T]):
                 f"{len(self.row_dict)} rows to it. (Did you reload the game with a new row count?)"
             )
 
-        param_row_ptr_address = param_data_address + self.PARAM_ROW_POINTER_OFFSET  # first row pointer
-        for i, (row_id, row_data) in enumerate(self.row_dict.items()):
+        row_pointers = self._read_row_pointers(param_data_address, row_count)
+        # Row names are only read back from memory for debug logging.
+        log_names = _LOGGER.isEnabledFor(logging.DEBUG)
+        for (row_id, row_data), (_, data_offset, name_offset) in zip(self.row_dict.items(), row_pointers):
             row_data: PARAM_ROW_DATA_T
-            data_offset = self.hook.read_int32(param_row_ptr_address + i * 12 + 4)
-            name_offset = self.hook.read_int32(param_row_ptr_address + i * 12 + 8)
-            raw_name = self.hook.read_z_bytes(param_data_address + name_offset)
-            if raw_name:
+            if log_names and (raw_name := self.hook.read_z_bytes(param_data_address + name_offset)):
                 _LOGGER.debug(f"Writing {self.draw_param_stem} row {row_id} with RawName: {raw_name}")
             self.hook.write(param_data_address + data_offset, row_data.to_bytes(byte_order=ByteOrder.LittleEndian))
 
+    def _read_row_pointers(self, param_data_address: int, row_count: int) -> list[tuple[int, int, int]]:
+        """Read `(row_id, data_offset, name_offset)` for every row with a single read of the row pointer table."""
+        if row_count <= 0:
+            return []
+        row_pointer_data = self.hook.read(
+            param_data_address + self.PARAM_ROW_POINTER_OFFSET, size=row_count * self._ROW_POINTER_STRUCT.size
+        )
+        return list(self._ROW_POINTER_STRUCT.iter_unpack(row_pointer_data))
+
     def _get_area_draw_param_list_address(self):
         draw_param_list_address = self.hook.read_int64(self.DRAW_PARAM_BASE)
         area_start = draw_param_list_address + 0x18 + (self.area_id - 10) * self.AREA_DRAW_PARAM_SIZE
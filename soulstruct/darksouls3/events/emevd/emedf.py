@@ -7,6 +7,7 @@ from __future__ import annotations
 import typing as tp
 
 from soulstruct.base.events.emevd.emedf import *
+from soulstruct.base.events.emevd.utils import get_item_type
 from soulstruct.darksouls3.game_types import *
 from soulstruct.darksouls3.maps.constants import get_map_variable_name
 from soulstruct.utilities.files import PACKAGE_PATH
@@ -62,7 +63,7 @@ GAME_MAP_EVS = {
 }
 ITEM_TYPE = {
     "type": ItemType,
-    "default": lambda args: args["item"].get_item_enum(),
+    "default": lambda args: get_item_type(args["item"]),
     "comment": "Auto-detected from `item` type by default.",
 }
 FLAG = {
@@ -5,6 +5,8 @@ __all__ = ["int_group_to_bit_set", "bit_set_to_int_group", "floatify"]
 import logging
 import struct
 
+import numpy as np
+
 _LOGGER = logging.getLogger("soulstruct")
 
 
@@ -13,10 +15,14 @@ def int_group_to_bit_set(flag_group, assert_size=None):
     zero-based indices of the draw groups bit field (which is unpacked/packed internally as 4/8 32-bit integers).
 
     So draw groups `[0b01001..110, 0b0, 0b000...001, 0b100...000]` would return `{1, 4, 29, 30, 95, 96}`.
+
+    Bits are unpacked with NumPy rather than tested one at a time in Python.
     """
     if not isinstance(flag_group, (list, tuple)) or (assert_size and len(flag_group) != assert_size):
         raise ValueError(f"Flag group must be a sequence of {assert_size} integers.")
-    return set([32 * i + j for i in range(4) for j in range(32) if (2 ** j) & flag_group[i]])
+    uints = np.asarray(flag_group, dtype="<u4")
+    bits = np.unpackbits(uints.view(np.uint8), bitorder="little")
+    return set(np.flatnonzero(bits).tolist())
 
 
 def bit_set_to_int_group(enabled_flags, group_size):
@@ -27,14 +33,14 @@ def bit_set_to_int_group(enabled_flags, group_size):
         if len(enabled_flags_set) != len(enabled_flags):
             _LOGGER.warning("Some flags values were present in flag sequence more than once. Ignoring repeats.")
         enabled_flags = enabled_flags_set
-    flag_group = [0] * group_size
     for flag in enabled_flags:
         if not isinstance(flag, int):
             raise ValueError(f"Non-integer value {flag} appeared in flag set (draw/display/navmesh/backread groups).")
         if not 0 <= flag <= max_flag:
             raise ValueError(f"Invalid draw/display/navmesh/backread index {flag} (must be between 0 and {max_flag}).")
-        flag_group[flag // 32] += 2 ** (flag % 32)
-    return flag_group
+    bits = np.zeros(32 * group_size, dtype=np.uint8)
+    bits[list(enabled_flags)] = 1
+    return np.packbits(bits, bitorder="little").view("<u4").tolist()
 
 
 def floatify(int32: int, signed=False) -> float:
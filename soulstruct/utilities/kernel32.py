@@ -1,6 +1,14 @@
+from __future__ import annotations
 
 __all__ = [
-    "kernel32", "PROCESS_VM_READ", "PROCESS_VM_WRITE", "PROCESS_VM_OPERATION", "PROCESS_ALL_ACCESS", "SIZE_T", "PSIZE_T"
+    "kernel32",
+    "PROCESS_VM_READ",
+    "PROCESS_VM_WRITE",
+    "PROCESS_VM_OPERATION",
+    "PROCESS_ALL_ACCESS",
+    "SIZE_T",
+    "PSIZE_T",
+    "find_process_id",
 ]
 
 import ctypes as c
@@ -15,6 +23,23 @@ PROCESS_VM_OPERATION = 0x0008
 PROCESS_ALL_ACCESS = 0x1F0FFF
 SIZE_T = c.c_size_t
 PSIZE_T = c.POINTER(SIZE_T)
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = c.c_void_p(-1).value
+
+
+class PROCESSENTRY32W(c.Structure):
+    _fields_ = [
+        ("dwSize", w.DWORD),
+        ("cntUsage", w.DWORD),
+        ("th32ProcessID", w.DWORD),
+        ("th32DefaultHeapID", SIZE_T),  # ULONG_PTR
+        ("th32ModuleID", w.DWORD),
+        ("cntThreads", w.DWORD),
+        ("th32ParentProcessID", w.DWORD),
+        ("pcPriClassBase", w.LONG),
+        ("dwFlags", w.DWORD),
+        ("szExeFile", w.WCHAR * w.MAX_PATH),
+    ]
 
 
 def _check_zero(result, _, args):  # second arg is `func` (unused here)
@@ -23,6 +48,12 @@ def _check_zero(result, _, args):  # second arg is `func` (unused here)
     return args
 
 
+def _check_invalid_handle(result, _, args):  # second arg is `func` (unused here)
+    if result is None or result == INVALID_HANDLE_VALUE:
+        raise c.WinError(c.get_last_error())
+    return result
+
+
 kernel32.OpenProcess.errcheck = _check_zero
 kernel32.OpenProcess.restype = w.HANDLE
 kernel32.OpenProcess.argtypes = (
@@ -52,3 +83,44 @@ kernel32.WriteProcessMemory.argtypes = (
 )
 
 kernel32.CloseHandle.argtypes = (w.HANDLE,)
+
+kernel32.CreateToolhelp32Snapshot.errcheck = _check_invalid_handle
+kernel32.CreateToolhelp32Snapshot.restype = w.HANDLE
+kernel32.CreateToolhelp32Snapshot.argtypes = (
+    w.DWORD,  # _In_ dwFlags
+    w.DWORD,  # _In_ th32ProcessID
+)
+
+kernel32.Process32FirstW.restype = w.BOOL
+kernel32.Process32FirstW.argtypes = (
+    w.HANDLE,  # _In_    hSnapshot
+    c.POINTER(PROCESSENTRY32W),  # _Inout_ lppe
+)
+
+kernel32.Process32NextW.restype = w.BOOL
+kernel32.Process32NextW.argtypes = (
+    w.HANDLE,  # _In_  hSnapshot
+    c.POINTER(PROCESSENTRY32W),  # _Out_ lppe
+)
+
+
+def find_process_id(exe_name: str) -> int | None:
+    """Find the ID of the first running process with executable name `exe_name`, or `None` if there is no such process.
+
+    Walks a single Toolhelp32 process snapshot, which contains every process name, rather than querying each process
+    separately. Names are compared case-insensitively, as Windows does. Raises `OSError` if the snapshot cannot be
+    created.
+    """
+    exe_name = exe_name.lower()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = c.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, c.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == exe_name:
+                return entry.th32ProcessID
+            found = kernel32.Process32NextW(snapshot, c.byref(entry))
+        return None
+    finally:
+        kernel32.CloseHandle(snapshot)
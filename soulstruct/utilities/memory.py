@@ -18,6 +18,8 @@ import logging
 import pickle
 import re
 import struct
+import threading
+import time
 import typing as tp
 
 from soulstruct.exceptions import SoulstructError
@@ -26,21 +28,15 @@ from soulstruct.utilities.kernel32 import *
 
 if tp.TYPE_CHECKING:
     from ctypes import wintypes as w
-
-try:
-    # noinspection PyPackageRequirements
-    import numpy
-except ImportError:
-    numpy = None
-
-try:
     # noinspection PyPackageRequirements
     import psutil
-except ImportError:
-    psutil = None
 
 _LOGGER = logging.getLogger("soulstruct")
 
+# Null-terminated strings are read in chunks of (at most) this size, which never cross a `_PAGE_SIZE` boundary.
+_STRING_CHUNK_SIZE = 64
+_PAGE_SIZE = 0x1000
+
 
 class UnhookedError(SoulstructError):
     """Raised when hook is lost. It will attempt to be reacquired on each call."""
@@ -67,34 +63,37 @@ class MemoryValue(tp.NamedTuple):
 def memory_hook_validate(method):
     """Decorator that checks the hooked process is still valid before continuing.
 
-    Tries to re-establish hook on call.
+    Tries to re-establish hook on call. Validated methods called (directly or indirectly) by another validated method
+    in the same thread skip the check, as the process was already validated by the outermost call.
     """
     @functools.wraps(method)
     def wrapped(*args, **kwargs):
         self = args[0]  # type: MemoryHook
+        validation_state = self._validation_state
+        if getattr(validation_state, "validated", False):
+            return method(*args, **kwargs)
         if not self.process or not self.process.is_running():
             # Lost (or never found) process. Try to reconnect.
             if not self.find_process():
                 raise UnhookedError(f"Could not hook into process '{self.PROCESS_NAME}'.")
-        return method(*args, **kwargs)
+        validation_state.validated = True
+        try:
+            return method(*args, **kwargs)
+        finally:
+            validation_state.validated = False
 
     return wrapped
 
 
 def memory_hook_cache(method):
-    """Updates cache from `__address_cache__` file before calling method, then writes latest `__address_cache__`."""
+    """Loads cache from `__address_cache__` file on first use by this hook, then writes it back if it has changed."""
 
     @functools.wraps(method)
     def wrapped(*args, **kwargs):
         self = args[0]  # type: MemoryHook
-        try:
-            with PACKAGE_PATH("__address_cache__").open("rb") as f:
-                self._address_cache = pickle.load(f)
-        except (FileNotFoundError, EOFError, ValueError):
-            self._address_cache = {}
+        self.load_address_cache()
         result = method(*args, **kwargs)
-        with PACKAGE_PATH("__address_cache__").open("wb") as f:
-            pickle.dump(self._address_cache, f)
+        self.save_address_cache()
         return result
 
     return wrapped
@@ -109,6 +108,9 @@ class MemoryHook(abc.ABC):
     EVENT_FLAG_OFFSETS = ()  # base address and jump offsets for event flags (not including flag-specific offset)
     BASE_POINTER_TABLE: dict[str, tp.Union[int, BasePointerSearch]] = {}
     VALUE_TABLE: dict[str, MemoryValue] = {}
+    # If positive, values returned by `get()` are reused for this many seconds (e.g. 0.016 for once per frame) instead
+    # of being read again, without checking the process is still running. Any `write()` or re-hook clears the cache.
+    VALUE_CACHE_TTL = 0.0
 
     MemoryHookCallError = MemoryHookCallError
     UnhookedError = UnhookedError
@@ -137,24 +139,19 @@ class MemoryHook(abc.ABC):
 
         # noinspection PyMethodOverriding
         def read(self, size: int) -> bytes:
-            output = b""
             if self._max_size is not None and self._bytes_read + size > self._max_size:
                 raise IOError(f"Tried to read more than specified maximum bytes ({self._max_size}) from process.")
-            bytes_to_read = size
-
-            while bytes_to_read > 0:
-                if not self._buffer:
-                    self._buffer = self._hook.read(self._current_address, self._chunk_size)
-                    self._current_address += self._chunk_size  # address for next buffer read
-
-                if bytes_to_read >= len(self._buffer):
-                    output += self._buffer
-                    bytes_to_read -= len(self._buffer)
-                    self._buffer = b""
-                else:  # less than buffer size
-                    output += self._buffer[:bytes_to_read]
-                    self._buffer = self._buffer[bytes_to_read:]
-                    bytes_to_read = 0
+
+            output = self._buffer[:size]
+            self._buffer = self._buffer[size:]
+            bytes_to_read = size - len(output)
+            if bytes_to_read > 0:
+                # Read all chunks needed in one process call and keep the unused end of the last chunk buffered.
+                chunk_count = -(-bytes_to_read // self._chunk_size)
+                data = self._hook.read(self._current_address, chunk_count * self._chunk_size)
+                self._current_address += chunk_count * self._chunk_size  # address for next buffer read
+                output += data[:bytes_to_read]
+                self._buffer = data[bytes_to_read:]
             self._stream_offset += size
             return output
 
@@ -168,39 +165,84 @@ class MemoryHook(abc.ABC):
 
     process: psutil.Process | None
     p_handle: w.HANDLE | None
+    # Its `validated` attribute is True while a `memory_hook_validate` method is running in that thread, so nested
+    # validated calls do not check the process again. Other threads using this hook still validate their own calls.
+    _validation_state: threading.local
 
-    def __init__(self):
+    def __init__(self, pid: int = None):
+        """Hook into the running `PROCESS_NAME` process, if found.
+
+        If the process ID is already known, pass it as `pid` to skip scanning all running processes for it.
+        """
 
-        if psutil is None:
+        # `psutil` is only imported once a hook is created, not with this module.
+        try:
+            # noinspection PyPackageRequirements
+            import psutil
+        except ImportError:
             raise ModuleNotFoundError("`psutil` package required to use Soulstruct `MemoryHook`.")
 
+        self._validation_state = threading.local()
         self.value_table = self.VALUE_TABLE
+        self._value_cache = {}  # type: dict[str, tuple[float, tp.Any]]  # maps value names to `(read_time, value)`
         self._address_cache = {}
+        self._address_cache_loaded = False
+        self._address_cache_dirty = False  # cache has changed since it was last loaded or saved
         self.base_pointer_table = {}  # type: dict[str, int]  # named, resolved base pointer addresses
 
         self.process = None
         self.p_handle = None
-        self.find_process()
+        self.find_process(pid)  # also loads `BASE_POINTER_TABLE` if process is found
+
+    def find_process(self, pid: int = None) -> bool:
+        """Find and open `PROCESS_NAME` process. If `pid` is given, only that process is checked."""
+        # noinspection PyPackageRequirements
+        import psutil  # availability checked in `__init__`
 
-        if self.p_handle and self.BASE_POINTER_TABLE:
-            self._load_pointer_table(self.BASE_POINTER_TABLE)
+        if pid is None:
+            # A single Toolhelp32 snapshot is much cheaper than querying every process through `psutil`.
+            try:
+                pid = find_process_id(self.PROCESS_NAME)
+            except OSError as ex:
+                _LOGGER.warning(f"Could not take process snapshot ({ex}). Scanning processes with `psutil` instead.")
+            else:
+                if pid is None:
+                    # _LOGGER.warning(f"Could not find process '{self.PROCESS_NAME}'.")
+                    return False
 
-    def find_process(self) -> bool:
-        for p in psutil.process_iter():
-            if p.name() == self.PROCESS_NAME:
-                self.process = p
-                _LOGGER.info(f"Found '{self.PROCESS_NAME}' process with PID: {p.pid}")
-                break
+        if pid is not None:
+            try:
+                p = psutil.Process(pid)
+                if p.name().lower() != self.PROCESS_NAME.lower():
+                    _LOGGER.warning(f"Process with PID {pid} is not '{self.PROCESS_NAME}'.")
+                    return False
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                _LOGGER.warning(f"Could not access process with PID {pid}.")
+                return False
+            self.process = p
+            _LOGGER.info(f"Found '{self.PROCESS_NAME}' process with PID: {p.pid}")
         else:
-            # _LOGGER.warning(f"Could not find process '{self.PROCESS_NAME}'.")
-            return False
+            # Only `name` is needed, which `process_iter()` fetches for every process in one `oneshot()` pass (and sets
+            # to `None` for processes that deny access, rather than raising).
+            for p in psutil.process_iter(attrs=["name"]):
+                if p.info["name"] == self.PROCESS_NAME:
+                    self.process = p
+                    _LOGGER.info(f"Found '{self.PROCESS_NAME}' process with PID: {p.pid}")
+                    break
+            else:
+                # _LOGGER.warning(f"Could not find process '{self.PROCESS_NAME}'.")
+                return False
 
+        if self.p_handle:
+            # Close handle to lost process before re-hooking.
+            kernel32.CloseHandle(self.p_handle)
         self.p_handle = kernel32.OpenProcess(
             PROCESS_VM_READ + PROCESS_VM_WRITE + PROCESS_VM_OPERATION,
             False,
             self.process.pid,
         )
         _LOGGER.info(f"Process handle for '{self.PROCESS_NAME}' opened successfully.")
+        self._value_cache.clear()  # values from any previous process
         if self.BASE_POINTER_TABLE:
             try:
                 self._load_pointer_table(self.BASE_POINTER_TABLE)
@@ -210,6 +252,36 @@ class MemoryHook(abc.ABC):
                 return False
         return True
 
+    def load_address_cache(self):
+        """Load `__address_cache__` file into this hook's address cache, unless already loaded.
+
+        The cache is only read from disk once per hook; after that, it is kept up to date in memory (and written back
+        to disk by `save_address_cache()` when changed).
+        """
+        if self._address_cache_loaded:
+            return
+        try:
+            with PACKAGE_PATH("__address_cache__").open("rb") as f:
+                self._address_cache = pickle.load(f)
+        except (FileNotFoundError, EOFError, ValueError):
+            self._address_cache = {}
+        self._address_cache_loaded = True
+
+    def set_cached_address(self, game_key: str, name: str, address: int):
+        """Record `address` for `name` in this hook's address cache under `game_key` (e.g. "ds1r")."""
+        game_cache = self._address_cache.setdefault(game_key, {})
+        if game_cache.get(name) != address:
+            game_cache[name] = address
+            self._address_cache_dirty = True
+
+    def save_address_cache(self):
+        """Write this hook's address cache to `__address_cache__` file, if it has changed since last load or save."""
+        if not self._address_cache_dirty:
+            return
+        with PACKAGE_PATH("__address_cache__").open("wb") as f:
+            pickle.dump(self._address_cache, f)
+        self._address_cache_dirty = False
+
     def __del__(self):
         try:
             kernel32.CloseHandle(self.p_handle)
@@ -261,6 +333,7 @@ class MemoryHook(abc.ABC):
         size = len(data)
         buffer = c.create_string_buffer(data)
         bytes_written = SIZE_T(0)
+        self.invalidate_value_cache()
         try:
             kernel32.WriteProcessMemory(self.p_handle, address, buffer, size, c.byref(bytes_written))
         except WindowsError as e:
@@ -293,41 +366,42 @@ class MemoryHook(abc.ABC):
     def read_double(self, address):
         return self.read(address, size=8, fmt="<d")
 
-    def read_z_bytes(self, address) -> bytes:
-        """Read a null-terminated single-byte-character string, without decoding it."""
-        raw_string = b""
+    def _read_until_terminator(self, address: int, terminator: bytes) -> bytes:
+        """Read memory from `address` up to (not including) the first `terminator` that is aligned to its own length.
+
+        Memory is read in small chunks that never cross a page boundary (so they are readable whenever the string's
+        first byte is), rather than one `ReadProcessMemory` call per character.
+        """
+        step = len(terminator)
+        data = bytearray()
         read_address = address
+        search_start = 0
         while True:
-            value = self.read(read_address, size=1)
-            if value[0] == 0:
-                # Null termination found.
-                return raw_string
-            raw_string += value
-            read_address += 1
+            size = min(_STRING_CHUNK_SIZE, _PAGE_SIZE - read_address % _PAGE_SIZE)
+            chunk = self.read(read_address, size=size)
+            if not chunk:
+                raise MemoryHookCallError(f"Could not read null-terminated string at address {hex(address)}.")
+            data += chunk
+            read_address += len(chunk)
+            index = data.find(terminator, search_start)
+            while index != -1 and index % step:
+                index = data.find(terminator, index + 1)
+            if index != -1:
+                return bytes(data[:index])
+            search_start = (len(data) - step + 1) // step * step if len(data) >= step else 0
+
+    def read_z_bytes(self, address) -> bytes:
+        """Read a null-terminated single-byte-character string, without decoding it."""
+        return self._read_until_terminator(address, b"\0")
 
     def read_z_string(self, address, encoding: str) -> str:
         """Read a null-terminated single-byte-character string."""
-        raw_string = b""
-        read_address = address
-        while True:
-            value = self.read(read_address, size=1)
-            if value[0] == 0:
-                # Null termination found.
-                return raw_string.decode(encoding)
-            raw_string += value
-            read_address += 1
+        return self._read_until_terminator(address, b"\0").decode(encoding)
 
     def read_utf16_z_string(self, address, big_endian=False) -> str:
         """Read a null-terminated UTF-16 string."""
-        raw_string = b""
-        read_address = address
-        while True:
-            value = self.read(read_address, size=2)
-            if value[0] == 0 and value[1] == 0:
-                # Null termination found.
-                return raw_string.decode("utf-16-be" if big_endian else "utf-16-le")
-            raw_string += value
-            read_address += 2
+        raw_string = self._read_until_terminator(address, b"\0\0")
+        return raw_string.decode("utf-16-be" if big_endian else "utf-16-le")
 
     def write_int16(self, address, value):
         return self.write(address, data=(value,), fmt="<h")
@@ -357,38 +431,38 @@ class MemoryHook(abc.ABC):
     def get_event_flag_offset_mask(self, flag_id: int):
         pass
 
-    @memory_hook_validate
-    def read_event_flag(self, flag_id: int) -> bool:
-        offset, mask = self.get_event_flag_offset_mask(flag_id)
-
+    def _get_event_flag_address(self, offset: int) -> int:
+        """Follow `EVENT_FLAG_OFFSETS` jumps to get address of 32-bit flag group at `offset`."""
         if not self.EVENT_FLAG_OFFSETS:
             raise ValueError(f"No `EVENT_FLAG_OFFSETS` defined for `{self.__class__.__name__}`.")
         address = self.EVENT_FLAG_OFFSETS[0]
         for jump in self.EVENT_FLAG_OFFSETS[1:]:
             address = self.read_int64(address + jump)
-        flags32 = self.read_uint32(address + offset)
+        return address + offset
+
+    @memory_hook_validate
+    def read_event_flag(self, flag_id: int) -> bool:
+        offset, mask = self.get_event_flag_offset_mask(flag_id)
+        flags32 = self.read_uint32(self._get_event_flag_address(offset))
         return flags32 & mask != 0
 
     @memory_hook_validate
     def write_event_flag(self, flag_id: int, state: bool):
         offset, mask = self.get_event_flag_offset_mask(flag_id)
-
-        if not self.EVENT_FLAG_OFFSETS:
-            raise ValueError(f"No `EVENT_FLAG_OFFSETS` defined for `{self.__class__.__name__}`.")
-        address = self.EVENT_FLAG_OFFSETS[0]
-        for jump in self.EVENT_FLAG_OFFSETS[1:]:
-            address = self.read_int64(address + jump)
-        flags32 = self.read_uint32(address + offset)
+        address = self._get_event_flag_address(offset)
+        flags32 = self.read_uint32(address)
         if state:
             flags32 |= mask
         else:
             flags32 &= ~mask
-        self.write_uint32(address + offset, flags32)
+        self.write_uint32(address, flags32)
 
     @staticmethod
     def _rolling_window(a, size):
         """From https://stackoverflow.com/questions/7100242/python-numpy-first-occurrence-of-subarray."""
-        if not numpy:
+        try:
+            import numpy
+        except ImportError:
             raise ModuleNotFoundError("Cannot use `_rolling_window()` without `numpy` package.")
         shape = a.shape[:-1] + (a.shape[-1] - size + 1, size)
         strides = a.strides + (a.strides[-1],)
@@ -411,7 +485,13 @@ class MemoryHook(abc.ABC):
         `pointer.address_func` is not `None`, the address will be fed through that function first. If the address is
         not found, the dictionary value will be `None`.
         """
-        use_numpy = prefer_numpy and numpy
+        numpy = None
+        if prefer_numpy:
+            try:
+                import numpy
+            except ImportError:
+                pass
+        use_numpy = numpy is not None
         pointer_int32_dict = {}
         if use_numpy:
             for pointer_name, pointer in pointers.items():
@@ -428,9 +508,22 @@ class MemoryHook(abc.ABC):
             largest_sequence_size = max(len(p) for p in pointer_int32_dict.values())
             stride = 4 * (chunk_size - largest_sequence_size)
         else:
-            largest_sequence_size = max(
-                len(p.sequence if isinstance(p, BasePointerSearch) else p) for p in pointers.values()
-            )
+            # Sequences (compiled if `use_regex`) and address functions are resolved once here, not per chunk.
+            search_table = []  # type: list[tuple[str, bytes | re.Pattern, tp.Callable | None]]
+            largest_sequence_size = 0
+            for pointer_name, pointer in pointers.items():
+                if isinstance(pointer, BasePointerSearch):
+                    sequence = pointer.sequence
+                    address_func = pointer.address_func
+                elif isinstance(pointer, bytes):
+                    sequence = pointer
+                    address_func = None
+                else:
+                    raise TypeError(f"Unsupported pointer type: {pointer}")
+                largest_sequence_size = max(largest_sequence_size, len(sequence))
+                if use_regex:
+                    sequence = re.compile(sequence, re.DOTALL)
+                search_table.append((pointer_name, sequence, address_func))
             stride = chunk_size - largest_sequence_size
 
         if largest_sequence_size >= chunk_size:
@@ -493,18 +586,10 @@ class MemoryHook(abc.ABC):
                                 found_pointers[pointer_name] = int(address)
                 else:
                     data = bytes(buffer[: bytes_read.value])
-                    for pointer_name, pointer in pointers.items():
-                        if isinstance(pointer, BasePointerSearch):
-                            sequence = pointer.sequence
-                            address_func = pointer.address_func
-                        elif isinstance(pointer, bytes):
-                            sequence = pointer
-                            address_func = None
-                        else:
-                            raise TypeError(f"Unsupported pointer type: {pointer}")
+                    for pointer_name, sequence, address_func in search_table:
                         address = None
                         if use_regex:
-                            if match := re.search(sequence, data, re.DOTALL):
+                            if match := sequence.search(data):
                                 address = search_from_address + match.start()
                         else:
                             if (index := data.find(sequence)) != -1:
@@ -543,8 +628,27 @@ class MemoryHook(abc.ABC):
         )
         return scan_result["x"]
 
-    @memory_hook_validate
     def get(self, value_name):
+        if self.VALUE_CACHE_TTL > 0:
+            # Cache is checked before the process is validated, as that check costs more than a cached value saves.
+            cached = self._value_cache.get(value_name)
+            if cached is not None and time.monotonic() - cached[0] < self.VALUE_CACHE_TTL:
+                return cached[1]
+        return self._read_value(value_name)
+
+    def invalidate_value_cache(self):
+        """Clear values cached by `get()` (if `VALUE_CACHE_TTL` is positive), so they are read again on next call."""
+        self._value_cache.clear()
+
+    @memory_hook_validate
+    def _read_value(self, value_name):
+        """Read `value_name` from process (and cache it, if `VALUE_CACHE_TTL` is positive)."""
+        value = self._read_value_uncached(value_name)
+        if self.VALUE_CACHE_TTL > 0:
+            self._value_cache[value_name] = (time.monotonic(), value)
+        return value
+
+    def _read_value_uncached(self, value_name):
         try:
             entry_data = self.value_table[value_name]
         except KeyError:
@@ -564,7 +668,7 @@ class MemoryHook(abc.ABC):
             try:
                 address = self.read_int64(address + jump)
             except MemoryHookCallError as ex:
-                MemoryHookCallError(f"Memory hook error encountered while reading field {value_name}: {ex}")
+                raise MemoryHookCallError(f"Memory hook error encountered while reading field {value_name}: {ex}")
         # noinspection PyCallingNonCallable,PyTypeChecker
         buffer = (c.c_char * entry_data.size)()
         bytes_read = SIZE_T()
@@ -1,7 +1,9 @@
 import os
 import unittest
 
+from soulstruct.base.maps.msb.utils import GroupBitSet256
 from soulstruct.bloodborne.maps import MSB
+from soulstruct.utilities.conversion import bit_set_to_int_group, int_group_to_bit_set
 
 
 class MSBTest(unittest.TestCase):
@@ -60,6 +62,18 @@ class MSBTest(unittest.TestCase):
                     source_field = getattr(entry, field_name)
                     self.assertEqual(source_field, test_field)
 
+    def test_group_bits(self):
+        """Convert 256-bit draw/display groups (eight uints) to bit sets and back, with bits in every uint."""
+        bit_set = {0, 31, 32, 95, 100, 128, 160, 200, 255}
+        uints = bit_set_to_int_group(bit_set, 8)
+        self.assertEqual(len(uints), 8)
+        self.assertTrue(all(uints))  # every uint has a bit set, including those after the first four
+        self.assertEqual(int_group_to_bit_set(uints, assert_size=8), bit_set)
+        self.assertEqual(uints, GroupBitSet256(bit_set).to_uints())
+        self.assertEqual(GroupBitSet256(uints).enabled_bits, bit_set)
+        with self.assertRaises(AttributeError):
+            GroupBitSet256(uints).enabled_bits.add(5)  # frozen, as changes would not be stored
+
 
 if __name__ == '__main__':
     unittest.main()
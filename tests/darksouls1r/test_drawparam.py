@@ -1,5 +1,37 @@
+import unittest
+
 from soulstruct import DSR_PATH
+from soulstruct.darksouls1ptde.params.draw_param import TypedDrawParam
 from soulstruct.darksouls1r.params.draw_param import DrawParamDirectory
+from soulstruct.darksouls1r.params.paramdef import FOG_BANK
+from soulstruct.darksouls1r.utilities.compare_draw_params import iter_row_matches
+
+
+class DrawParamTest(unittest.TestCase):
+
+    def test_get_nonzero_entries(self):
+        fog_param = TypedDrawParam(FOG_BANK)(
+            rows={
+                0: FOG_BANK(Name="Depths Fog"),
+                1: FOG_BANK(Name="PolyG_Fog"),
+                2: FOG_BANK(Name="polyg lowercase"),
+                3: FOG_BANK(Name="0_Unused"),
+                4: FOG_BANK(Name=""),
+            }
+        )
+        # 'PolyG' rows are excluded by default.
+        self.assertEqual(list(fog_param.get_nonzero_entries()), [0])
+        self.assertEqual(list(fog_param.get_nonzero_entries(ignore_polyg=False)), [0, 1, 2])
+
+    def test_compare_row_ids(self):
+        fog_one = {0: FOG_BANK(Name="Fog"), 5: FOG_BANK(Name="Fog 5")}
+        fog_two = {0: FOG_BANK(Name="Fog"), 90000: FOG_BANK(Name="Fog 90000")}
+        matches = list(iter_row_matches([fog_one, fog_two], ("One", "Two")))
+        # Every present row ID is compared, including the largest one.
+        self.assertEqual([row_id for row_id, _, _ in matches], [0, 5, 90000])
+        self.assertEqual(matches[0], (0, [fog_one[0], fog_two[0]], []))
+        self.assertEqual(matches[1], (5, [fog_one[5]], ["Two"]))
+        self.assertEqual(matches[2], (90000, [fog_two[90000]], ["One"]))
 
 
 def main():
@@ -0,0 +1,63 @@
+import sys
+import unittest
+
+
+class StubProcess:
+
+    def __init__(self):
+        self.is_running_calls = 0
+
+    def is_running(self):
+        self.is_running_calls += 1
+        return True
+
+
+@unittest.skipUnless(sys.platform == "win32", "`MemoryHook` requires Windows `kernel32`.")
+class MemoryHookTest(unittest.TestCase):
+
+    def setUp(self):
+        from soulstruct.utilities.memory import MemoryHook
+
+        class StubHook(MemoryHook):
+            """Hook that reads an incrementing counter instead of process memory."""
+            PROCESS_NAME = "stub.exe"
+            VALUE_CACHE_TTL = 60.0
+            reads = 0
+
+            def find_process(self, pid: int = None) -> bool:
+                self.process = StubProcess()
+                return True
+
+            def _read_value_uncached(self, value_name):
+                self.reads += 1
+                return self.reads
+
+            def get_event_flag_offset_mask(self, flag_id: int):
+                raise NotImplementedError
+
+        self.hook_type = StubHook
+
+    def test_value_cache(self):
+        """Cached values are returned without reading or validating the process again."""
+        hook = self.hook_type()
+        self.assertEqual(hook.get("x"), 1)
+        self.assertEqual(hook.process.is_running_calls, 1)
+        self.assertEqual(hook.get("x"), 1)
+        self.assertEqual(hook.process.is_running_calls, 1)  # cache hit is not validated
+        self.assertEqual(hook.get("y"), 2)
+        self.assertEqual(hook.process.is_running_calls, 2)
+
+        hook.invalidate_value_cache()
+        self.assertEqual(hook.get("x"), 3)
+        self.assertEqual(hook.process.is_running_calls, 3)
+
+    def test_value_cache_disabled(self):
+        hook = self.hook_type()
+        hook.VALUE_CACHE_TTL = 0.0
+        self.assertEqual(hook.get("x"), 1)
+        self.assertEqual(hook.get("x"), 2)
+        self.assertEqual(hook.process.is_running_calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
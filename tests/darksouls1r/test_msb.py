@@ -4,6 +4,7 @@ import unittest
 from pathlib import Path
 
 from soulstruct.base.maps.enum_module_generator import EnumModuleGenerator
+from soulstruct.base.maps.msb.utils import translate_all
 from soulstruct.darksouls1r.maps import MSB, MapStudioDirectory
 from soulstruct.utilities.maths import Vector3
 from soulstruct.utilities.inspection import profile_function, Timer
@@ -90,6 +91,23 @@ class MSBTest(unittest.TestCase):
             # os.remove("_test_msb.json")
             pass
 
+    def test_translate_all(self):
+        """Entries that share one `translate` vector are each translated once."""
+        msb = MSB.from_path("resources/m10_00_00_00.msb")
+        part = msb.characters[0]
+        region = msb.get_regions()[0]
+        region.translate = part.translate
+        collision = msb.collisions[0]
+        source_translate = part.translate.copy()
+        source_collision_translate = collision.translate.copy()
+        source_height = collision.reflect_plane_height
+
+        translate_all(msb, Vector3([1.0, 2.0, 3.0]))
+        self.assertEqual(part.translate, source_translate + Vector3([1.0, 2.0, 3.0]))
+        self.assertEqual(region.translate, source_translate + Vector3([1.0, 2.0, 3.0]))
+        self.assertEqual(collision.translate, source_collision_translate + Vector3([1.0, 2.0, 3.0]))
+        self.assertEqual(collision.reflect_plane_height, source_height + 2.0)
+
     def test_entities_module(self):
         msb = MSB.from_path("resources/m10_00_00_00.msb")
         emg = EnumModuleGenerator(msb)
@@ -1,8 +1,11 @@
 import os
+import pickle
 import unittest
 from pathlib import Path
 
+from soulstruct.base.params.param import TypedParam
 from soulstruct.darksouls1r.params import GameParamBND, ParamDefBND
+from soulstruct.darksouls1r.params.paramdef import EQUIP_PARAM_GOODS_ST
 from soulstruct.utilities.inspection import Timer
 
 
@@ -54,5 +57,56 @@ class ParamsTest(unittest.TestCase):
                 os.remove(str(test_file))
 
 
+class ParamFieldsTest(unittest.TestCase):
+
+    def setUp(self):
+        # Row IDs deliberately not in sorted order: columns follow row (dictionary) order.
+        self.goods_param = TypedParam(EQUIP_PARAM_GOODS_ST)(
+            rows={
+                300: EQUIP_PARAM_GOODS_ST(Name="Good 300", BasicCost=30, Weight=3.0),
+                100: EQUIP_PARAM_GOODS_ST(Name="Good 100", BasicCost=10, Weight=1.0),
+                200: EQUIP_PARAM_GOODS_ST(Name="Good 200", BasicCost=20, Weight=2.0),
+            }
+        )
+
+    def test_field_column(self):
+        # Nickname and internal name give the same column.
+        self.assertEqual(self.goods_param.get_field_column("BasicCost"), [30, 10, 20])
+        self.assertEqual(self.goods_param.get_field_column("basicPrice"), [30, 10, 20])
+        self.assertEqual(self.goods_param.get_field_array("weight").tolist(), [3.0, 1.0, 2.0])
+        with self.assertRaises(KeyError):
+            self.goods_param.get_field_column("NotAField")
+        with self.assertRaises(KeyError):
+            self.goods_param.get_field_array("NotAField")
+
+    def test_row_state(self):
+        row = self.goods_param.rows[100]
+        state = row.__getstate__()
+        self.assertEqual(pickle.loads(pickle.dumps(row)).__getstate__(), state)
+        with self.assertRaises(ValueError):
+            EQUIP_PARAM_GOODS_ST().__setstate__(state[:-1])  # e.g. pickled with a different paramdef
+
+    def test_field_records(self):
+        records = self.goods_param.get_field_records(["BasicCost", "weight"])
+        self.assertEqual(records.dtype.names, ("RowID", "BasicCost", "weight"))
+        self.assertEqual(records["RowID"].tolist(), [300, 100, 200])
+        self.assertEqual(records["BasicCost"].tolist(), [30, 10, 20])
+        self.assertEqual(records[records["weight"] > 1.5]["RowID"].tolist(), [300, 200])
+        with self.assertRaises(KeyError):
+            self.goods_param.get_field_records(["NotAField"])
+
+        # All binary fields by default.
+        all_records = self.goods_param.get_field_records()
+        self.assertEqual(all_records.dtype.names, ("RowID", *EQUIP_PARAM_GOODS_ST.get_binary_field_names()))
+
+    def test_empty_param(self):
+        empty_param = TypedParam(EQUIP_PARAM_GOODS_ST)()
+        self.assertEqual(empty_param.get_field_column("BasicCost"), [])
+        self.assertEqual(len(empty_param.get_field_array("BasicCost")), 0)
+        records = empty_param.get_field_records(["BasicCost"])
+        self.assertEqual(len(records), 0)
+        self.assertEqual(records.dtype.names, ("RowID", "BasicCost"))
+
+
 if __name__ == '__main__':
     unittest.main()
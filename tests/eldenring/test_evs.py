@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from soulstruct.base.events.evs import core as evs_core
+from soulstruct.eldenring.events.emevd.evs import EVSParser
+
+COMMON_FUNC_EVS = '''"""
+linked:
+
+strings:
+
+"""
+from soulstruct.eldenring.events import *
+from soulstruct.eldenring.events.instructions import *
+from _test_cf_constants import *
+
+
+@RestartOnRest(90005100)
+def CommonFunc_90005100(_, flag: uint, asset: uint):
+    """CommonFunc 90005100"""
+    EndIfFlagEnabled(flag)
+    DisableAsset(asset)
+    EnableFlag(CF_FLAG)
+'''
+
+MAP_EVS = '''"""
+linked:
+0
+
+strings:
+0: N:\\\\GR\\\\data\\\\Param\\\\event\\\\common_func.emevd
+"""
+# [COMMON_FUNC]
+from .{package}common_func import CommonFunc_90005100
+from soulstruct.eldenring.events import *
+from soulstruct.eldenring.events.instructions import *
+
+
+@ContinueOnRest(0)
+def Constructor():
+    """Event 0"""
+    CommonFunc_90005100(0, flag=10000000, asset=10001000)
+'''
+
+
+def touch(path: Path):
+    """Move modified time forward a second, regardless of file system timestamp resolution."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class CommonFuncCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.evs_dir = Path(self.temp_dir.name)
+        (self.evs_dir / "_test_cf_constants.py").write_text("CF_FLAG = 10000100\n")
+        (self.evs_dir / "common_func.py").write_text(COMMON_FUNC_EVS)
+        (self.evs_dir / "m10_00_00_00.evs.py").write_text(MAP_EVS.format(package=""))
+        (self.evs_dir / "m11_00_00_00.evs.py").write_text(MAP_EVS.format(package=""))
+        evs_core.clear_common_func_cache()
+
+    def tearDown(self):
+        evs_core.clear_common_func_cache()
+        sys.modules.pop("_test_cf_constants", None)
+        self.temp_dir.cleanup()
+
+    def parse(self, evs_name: str):
+        """Parse map script and return its (single) cached COMMON_FUNC entry."""
+        evs = EVSParser(self.evs_dir / evs_name)
+        self.assertIn("CommonFunc_90005100", evs.common_func_events)
+        self.assertEqual(len(evs_core._COMMON_FUNC_CACHE), 1)
+        return next(iter(evs_core._COMMON_FUNC_CACHE.values()))
+
+    def test_cache_hit(self):
+        cached = self.parse("m10_00_00_00.evs.py")
+        self.assertIs(self.parse("m11_00_00_00.evs.py"), cached)
+        self.assertIs(self.parse("m10_00_00_00.evs.py"), cached)
+
+    def test_common_func_changed(self):
+        cached = self.parse("m10_00_00_00.evs.py")
+        touch(self.evs_dir / "common_func.py")
+        self.assertIsNot(self.parse("m11_00_00_00.evs.py"), cached)
+
+    def test_imported_module_changed(self):
+        cached = self.parse("m10_00_00_00.evs.py")
+        touch(self.evs_dir / "_test_cf_constants.py")
+        self.assertIsNot(self.parse("m11_00_00_00.evs.py"), cached)
+
+    def test_script_directory(self):
+        """Same COMMON_FUNC module is cached separately for each importing script directory."""
+        (self.evs_dir / "common").mkdir()
+        (self.evs_dir / "common/common_func.py").write_text(COMMON_FUNC_EVS)
+        (self.evs_dir / "common/_test_cf_constants.py").write_text("CF_FLAG = 10000100\n")
+        (self.evs_dir / "m12_00_00_00.evs.py").write_text(MAP_EVS.format(package="common."))
+        (self.evs_dir / "common/m13_00_00_00.evs.py").write_text(MAP_EVS.format(package=""))
+        EVSParser(self.evs_dir / "m12_00_00_00.evs.py")
+        EVSParser(self.evs_dir / "common/m13_00_00_00.evs.py")
+        self.assertEqual(len(evs_core._COMMON_FUNC_CACHE), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
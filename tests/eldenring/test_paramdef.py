@@ -0,0 +1,24 @@
+import importlib
+import unittest
+
+from soulstruct.base.params.param_row import ParamRow
+from soulstruct.eldenring.params import paramdef
+
+
+class ParamDefTest(unittest.TestCase):
+
+    def test_lazy_classes(self):
+        """Row classes are resolved through the package, even after their submodules are imported directly."""
+        module = importlib.import_module("soulstruct.eldenring.params.paramdef.SP_EFFECT_PARAM_ST")
+        self.assertIs(paramdef.SP_EFFECT_PARAM_ST, module.SP_EFFECT_PARAM_ST)
+        self.assertIs(getattr(paramdef, "SP_EFFECT_PARAM_ST"), module.SP_EFFECT_PARAM_ST)
+        self.assertTrue(issubclass(paramdef.SP_EFFECT_PARAM_ST, ParamRow))
+
+        self.assertTrue(issubclass(paramdef.ATK_PARAM_ST, ParamRow))  # not imported until now
+        self.assertIn("BULLET_PARAM_ST", dir(paramdef))
+        with self.assertRaises(AttributeError):
+            _ = paramdef.NOT_A_PARAM_ST
+
+
+if __name__ == '__main__':
+    unittest.main()